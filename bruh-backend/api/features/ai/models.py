@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
 
-from api.features.conversations.models import Message
+from api.features.conversations.models import Conversation, Message
 
 
 class AIResponse(models.Model):
@@ -63,8 +65,197 @@ class AIResponse(models.Model):
             models.Index(fields=["provider"]),
             models.Index(fields=["is_structured_output"]),
             models.Index(fields=["provider", "is_structured_output"]),
+            models.Index(fields=["provider", "model_used", "created_at"]),
         ]
 
     def __str__(self):
         structured_flag = " [STRUCTURED]" if self.is_structured_output else ""
         return f"[{self.provider}] {self.model_used}{structured_flag} - {self.request_id[:10]}"
+
+
+class AIResponseDaily(models.Model):
+    """
+    Per-day usage rollup of AIResponse, kept current by the receivers below so the
+    cost dashboard can aggregate over days instead of individual responses.
+
+    Deleting a conversation or message subtracts its responses. Deleting an
+    AIResponse row on its own does not: a delete receiver on AIResponse would stop
+    Django from fast-deleting responses in those cascades.
+    """
+
+    date = models.DateField()
+    provider = models.CharField(max_length=50)
+    model_used = models.CharField(max_length=100)
+    # Not nullable: NULLs never match in the unique constraint the upsert targets
+    is_structured_output = models.BooleanField(default=False)
+
+    request_count = models.PositiveIntegerField(default=0)
+    usage_count = models.PositiveIntegerField(default=0)  # responses that reported tokens
+    cost_count = models.PositiveIntegerField(default=0)  # responses that reported a cost
+
+    total_cost = models.DecimalField(max_digits=14, decimal_places=6, default=0)
+    prompt_tokens = models.BigIntegerField(default=0)
+    completion_tokens = models.BigIntegerField(default=0)
+    reasoning_tokens = models.BigIntegerField(default=0)
+    total_tokens = models.BigIntegerField(default=0)
+
+    # Responses with total_tokens > 0, for the mean cost-per-token ranking
+    tokened_count = models.PositiveIntegerField(default=0)
+    tokened_cost = models.DecimalField(max_digits=14, decimal_places=6, default=0)
+    cost_per_token_sum = models.FloatField(default=0)
+
+    class Meta:
+        ordering = ["-date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "provider", "model_used", "is_structured_output"],
+                name="uniq_airesponse_daily_bucket",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date} [{self.provider}] {self.model_used} - {self.request_count} requests"
+
+
+# (column, aggregate over api_airesponse) for each counter in the rollup
+_DAILY_AGGREGATES = (
+    ("request_count", "COUNT(*)"),
+    ("usage_count", "COUNT(total_tokens)"),
+    ("cost_count", "COUNT(cost)"),
+    ("total_cost", "COALESCE(SUM(cost), 0)"),
+    ("prompt_tokens", "COALESCE(SUM(prompt_tokens), 0)"),
+    ("completion_tokens", "COALESCE(SUM(completion_tokens), 0)"),
+    ("reasoning_tokens", "COALESCE(SUM(reasoning_tokens), 0)"),
+    ("total_tokens", "COALESCE(SUM(total_tokens), 0)"),
+    ("tokened_count", "SUM(CASE WHEN total_tokens > 0 THEN 1 ELSE 0 END)"),
+    ("tokened_cost", "COALESCE(SUM(CASE WHEN total_tokens > 0 THEN cost END), 0)"),
+    (
+        "cost_per_token_sum",
+        "COALESCE(SUM(CASE WHEN total_tokens > 0 THEN CAST(cost AS REAL) / total_tokens END), 0)",
+    ),
+)
+_DAILY_COUNTERS = tuple(column for column, _ in _DAILY_AGGREGATES)
+_DAILY_BUCKET = ("date", "provider", "model_used", "is_structured_output")
+_DAILY_TABLE = AIResponseDaily._meta.db_table
+
+_DAILY_UPSERT_SQL = """
+INSERT INTO {table} ({bucket}, {counters})
+VALUES (%s, %s, %s, %s, {placeholders})
+ON CONFLICT ({bucket}) DO UPDATE SET {increments}
+""".format(
+    table=_DAILY_TABLE,
+    bucket=", ".join(_DAILY_BUCKET),
+    counters=", ".join(_DAILY_COUNTERS),
+    placeholders=", ".join("%s" for _ in _DAILY_COUNTERS),
+    increments=", ".join(f"{column} = {column} + excluded.{column}" for column in _DAILY_COUNTERS),
+)
+
+# Same grouping as the migration backfill: UTC day, NULL is_structured_output as False
+_DAILY_AGGREGATE_SQL = """
+SELECT date(created_at) AS date, provider, model_used,
+    COALESCE(is_structured_output, 0) AS is_structured_output, {aggregates}
+FROM {responses}
+WHERE {{where}}
+GROUP BY 1, 2, 3, 4
+""".format(
+    responses=AIResponse._meta.db_table,
+    aggregates=", ".join(f"{sql} AS {column}" for column, sql in _DAILY_AGGREGATES),
+)
+
+_DAILY_DECREMENT_SQL = """
+UPDATE {table} SET {decrements}
+FROM ({aggregate}) AS removed
+WHERE {matches}
+""".format(
+    table=_DAILY_TABLE,
+    decrements=", ".join(
+        f"{column} = {_DAILY_TABLE}.{column} - removed.{column}" for column in _DAILY_COUNTERS
+    ),
+    aggregate=_DAILY_AGGREGATE_SQL,
+    matches=" AND ".join(f"{_DAILY_TABLE}.{column} = removed.{column}" for column in _DAILY_BUCKET),
+)
+
+_DAILY_PRUNE_SQL = f"DELETE FROM {_DAILY_TABLE} WHERE request_count <= 0"
+
+_DAILY_CLEAR_DAY_SQL = f"DELETE FROM {_DAILY_TABLE} WHERE date = %s"
+
+_DAILY_REBUILD_SQL = "INSERT INTO {table} ({bucket}, {counters}) {aggregate}".format(
+    table=_DAILY_TABLE,
+    bucket=", ".join(_DAILY_BUCKET),
+    counters=", ".join(_DAILY_COUNTERS),
+    aggregate=_DAILY_AGGREGATE_SQL,
+)
+
+
+def _daily_bucket(instance):
+    # NULL is_structured_output counts as False, matching the backfill and the dashboard
+    return [
+        instance.created_at.date(),
+        instance.provider,
+        instance.model_used,
+        bool(instance.is_structured_output),
+    ]
+
+
+def _daily_counters(instance):
+    # Callers pass floats; keep the sums exact in the decimal columns
+    cost = AIResponse._meta.get_field("cost").to_python(instance.cost)
+    has_tokens = bool(instance.total_tokens) and instance.total_tokens > 0
+
+    return [
+        1,
+        int(instance.total_tokens is not None),
+        int(cost is not None),
+        cost or 0,
+        instance.prompt_tokens or 0,
+        instance.completion_tokens or 0,
+        instance.reasoning_tokens or 0,
+        instance.total_tokens or 0,
+        int(has_tokens),
+        (cost or 0) if has_tokens else 0,
+        float(cost or 0) / instance.total_tokens if has_tokens else 0,
+    ]
+
+
+def _remove_from_daily_rollup(responses):
+    # One grouped UPDATE for the whole batch rather than a statement per response
+    subquery, params = responses.values("pk").query.sql_with_params()
+    where = f"id IN ({subquery})"
+
+    with connection.cursor() as cursor:
+        cursor.execute(_DAILY_DECREMENT_SQL.format(where=where), params)
+        cursor.execute(_DAILY_PRUNE_SQL)
+
+
+@receiver(post_save, sender=AIResponse)
+def update_daily_rollup(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        # A single upsert, so concurrent responses for the same bucket can't lose increments
+        with connection.cursor() as cursor:
+            cursor.execute(
+                _DAILY_UPSERT_SQL, [*_daily_bucket(instance), *_daily_counters(instance)]
+            )
+        return
+
+    # Edits (from the admin) can move a response between buckets, so rebuild its whole day
+    day = instance.created_at.date()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(_DAILY_CLEAR_DAY_SQL, [day])
+        cursor.execute(_DAILY_REBUILD_SQL.format(where="date(created_at) = %s"), [day])
+
+
+@receiver(pre_delete, sender=Conversation)
+def remove_conversation_from_daily_rollup(sender, instance, **kwargs):
+    _remove_from_daily_rollup(AIResponse.objects.filter(message__conversation=instance))
+
+
+@receiver(pre_delete, sender=Message)
+def remove_message_from_daily_rollup(sender, instance, origin=None, **kwargs):
+    # Messages deleted by a conversation (or user) cascade were counted by the receiver above
+    if origin is not instance and getattr(origin, "model", None) is not Message:
+        return
+
+    _remove_from_daily_rollup(AIResponse.objects.filter(message=instance))
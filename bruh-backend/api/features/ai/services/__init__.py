@@ -5,7 +5,12 @@ from .chat_orchestration_service import (
     ChatSuccessResponse,
     get_chat_orchestration_service,
 )
-from .factory import get_ai_service, get_user_aux_model
+from .factory import (
+    get_ai_service,
+    get_user_aux_model,
+    supports_structured_outputs_cached,
+    validate_model_id_cached,
+)
 from .ollama_sevice import OllamaService, get_ollama_service
 from .open_router_service import OpenRouterService, get_open_router_service
 
@@ -21,4 +26,6 @@ __all__ = [
     "AIServiceBase",
     "get_ai_service",
     "get_user_aux_model",
+    "validate_model_id_cached",
+    "supports_structured_outputs_cached",
 ]
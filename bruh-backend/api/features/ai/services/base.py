@@ -2,12 +2,30 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from django.core.cache import cache
+
 logger = logging.getLogger(__name__)
 
 
 class AIServiceBase(ABC):
     """Base class for AI service providers with shared functionality"""
 
+    # Cache key holding a counter that is bumped whenever the model catalog is re-fetched
+    # or cleared; per-model lookups cached outside the service include it in their keys
+    CATALOG_VERSION_KEY: str
+
+    def catalog_version(self) -> int:
+        return cache.get_or_set(self.CATALOG_VERSION_KEY, 0, None)
+
+    def bump_catalog_version(self):
+        try:
+            cache.incr(self.CATALOG_VERSION_KEY)
+        except ValueError:
+            cache.set(self.CATALOG_VERSION_KEY, 1, None)
+
+    async def aclose(self) -> None:
+        """Close any HTTP client the service holds on to; nothing to do by default"""
+
     @abstractmethod
     async def chat_with_structured_output(
         self,
@@ -1,6 +1,7 @@
-from typing import Tuple
+from typing import Callable, Dict, Tuple
 
 from asgiref.sync import sync_to_async
+from django.core.cache import cache
 
 from api.features.users.models import Profile
 
@@ -8,6 +9,14 @@ from .base import AIServiceBase
 from .ollama_sevice import get_ollama_service
 from .open_router_service import get_open_router_service
 
+_SERVICE_GETTERS: Dict[str, Callable[[], AIServiceBase]] = {
+    "ollama": get_ollama_service,
+    "openrouter": get_open_router_service,
+}
+
+# Filled on first use so the services aren't constructed at import time
+_SERVICES: Dict[str, AIServiceBase] = {}
+
 
 def get_ai_service(provider: str) -> AIServiceBase:
     """
@@ -22,11 +31,55 @@ def get_ai_service(provider: str) -> AIServiceBase:
     Raises:
         ValueError: If provider is unknown
     """
-    if provider == "ollama":
-        return get_ollama_service()
-    elif provider == "openrouter":
-        return get_open_router_service()
-    raise ValueError(f"Unknown AI provider: {provider}")
+    service = _SERVICES.get(provider)
+    if service is None:
+        getter = _SERVICE_GETTERS.get(provider)
+        if getter is None:
+            raise ValueError(f"Unknown AI provider: {provider}")
+        service = _SERVICES[provider] = getter()
+    return service
+
+
+async def close_ai_services() -> None:
+    """Close the HTTP clients of the services created so far, before their event loop ends"""
+    for service in _SERVICES.values():
+        await service.aclose()
+
+
+async def validate_model_id_cached(provider: str, model_id: str) -> bool:
+    """
+    validate_model_id memoized per (provider, model_id)
+
+    Keys include the provider's catalog version, so entries (including negative ones)
+    are dropped as soon as the model list is re-fetched or cleared
+    """
+    service = get_ai_service(provider)
+    cache_key = f"model_valid:{provider}:{service.catalog_version()}:{model_id}"
+
+    is_valid = cache.get(cache_key)
+    if is_valid is None:
+        is_valid = await service.validate_model_id(model_id)
+        cache.set(cache_key, is_valid, service.CACHE_TIMEOUT)
+
+    return is_valid
+
+
+async def supports_structured_outputs_cached(provider: str, model_id: str) -> bool:
+    """
+    supports_structured_outputs memoized per (provider, model_id)
+
+    Keys include the provider's catalog version, so entries (including negative ones)
+    are dropped as soon as the model list is re-fetched or cleared
+    """
+    service = get_ai_service(provider)
+    cache_key = f"model_structured:{provider}:{service.catalog_version()}:{model_id}"
+
+    supported = cache.get(cache_key)
+    if supported is None:
+        supported = await service.supports_structured_outputs(model_id, use_cache=True)
+        cache.set(cache_key, supported, service.CACHE_TIMEOUT)
+
+    return supported
 
 
 async def get_user_aux_model(user) -> Tuple[str, str] | Tuple[None, None]:
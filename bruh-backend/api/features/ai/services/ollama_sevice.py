@@ -21,6 +21,7 @@ class OllamaService(AIServiceBase):
     MODELS_CACHE_KEY = "ollama_all_models_data"
     STRUCTURED_MODELS_CACHE_KEY = "ollama_structured_models_data"
     VISION_MODELS_CACHE_KEY = "ollama_vision_models_data"
+    CATALOG_VERSION_KEY = "ollama_catalog_version"
     CACHE_TIMEOUT = 60 * 5  # 5 minutes for local models
 
     def __init__(self):
@@ -335,6 +336,7 @@ class OllamaService(AIServiceBase):
             if use_cache:
                 cache.set(self.MODELS_CACHE_KEY, models_data, self.CACHE_TIMEOUT)
                 logger.debug(f"Cached {len(models_data)} models")
+            self.bump_catalog_version()
 
             return models_data
 
@@ -551,6 +553,7 @@ class OllamaService(AIServiceBase):
         cache.delete(self.MODELS_CACHE_KEY)
         cache.delete(self.STRUCTURED_MODELS_CACHE_KEY)
         cache.delete(self.VISION_MODELS_CACHE_KEY)
+        self.bump_catalog_version()
         logger.info("🧹 Cleared Ollama cache")
 
     async def is_running(self) -> bool:
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import json
 import logging
@@ -21,6 +22,8 @@ class OpenRouterService(AIServiceBase):
     MODELS_CACHE_KEY = "openrouter_all_models_data"
     STRUCTURED_MODELS_CACHE_KEY = "openrouter_structured_models_data"
     IMAGE_GEN_MODELS_CACHE_KEY = "openrouter_image_gen_models_data"
+    VALID_MODEL_IDS_CACHE_KEY = "openrouter_valid_model_ids"
+    CATALOG_VERSION_KEY = "openrouter_catalog_version"
     CACHE_TIMEOUT = 60 * 60
 
     VALID_ASPECT_RATIOS = {
@@ -48,6 +51,41 @@ class OpenRouterService(AIServiceBase):
         self.api_key = config.open_router.open_router_api_key
         self.base_url = "https://openrouter.ai/api/v1"
 
+        self._models_lock: asyncio.Lock | None = None
+        self._models_lock_loop: asyncio.AbstractEventLoop | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Shared client so requests reuse pooled connections, recreated per event loop"""
+        loop = asyncio.get_running_loop()
+        if self._http_client is not None and self._http_client_loop is not loop:
+            stale_client, stale_loop = self._http_client, self._http_client_loop
+            self._http_client = None
+            # Its pooled connections belong to the old loop, so they can only be closed there.
+            # One-off loops (celery tasks) are gone by now and close the client via aclose()
+            if not stale_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(stale_client.aclose(), stale_loop)
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient()
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared client; callers running a one-off event loop do this before it ends"""
+        if self._http_client is not None and self._http_client_loop is asyncio.get_running_loop():
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_client_loop = None
+
+    def _get_models_lock(self) -> asyncio.Lock:
+        """Lock for the catalog fetch, recreated per event loop (celery runs a new loop per task)"""
+        loop = asyncio.get_running_loop()
+        if self._models_lock is None or self._models_lock_loop is not loop:
+            self._models_lock = asyncio.Lock()
+            self._models_lock_loop = loop
+        return self._models_lock
+
     def _get_conversation_starters_schema(self) -> dict:
         """Get OpenRouter-style schema"""
         return {
@@ -158,14 +196,12 @@ class OpenRouterService(AIServiceBase):
         if max_tokens is not None:
             payload["max_tokens"] = max_tokens
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url, json=payload, headers=self._get_headers(), timeout=60.0
-            )
-            response.raise_for_status()
+        client = self._get_http_client()
+        response = await client.post(url, json=payload, headers=self._get_headers(), timeout=60.0)
+        response.raise_for_status()
 
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+        data = response.json()
+        return data["choices"][0]["message"]["content"]
 
     async def chat_with_messages_stream(
         self,
@@ -195,22 +231,22 @@ class OpenRouterService(AIServiceBase):
         if image_config is not None:
             payload["image_config"] = image_config
 
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST", url, json=payload, headers=self._get_headers(), timeout=60.0
-            ) as response:
-                logger.info(f"Response status: {response.status_code}")
-
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    logger.error(f"OpenRouter API error: {error_text.decode()}")
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        if data.strip() == "[DONE]":
-                            break
-                        yield data
+        client = self._get_http_client()
+        async with client.stream(
+            "POST", url, json=payload, headers=self._get_headers(), timeout=60.0
+        ) as response:
+            logger.info(f"Response status: {response.status_code}")
+
+            if response.status_code != 200:
+                error_text = await response.aread()
+                logger.error(f"OpenRouter API error: {error_text.decode()}")
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
+                    if data.strip() == "[DONE]":
+                        break
+                    yield data
 
     async def chat_with_structured_output(
         self,
@@ -247,27 +283,25 @@ class OpenRouterService(AIServiceBase):
 
         logger.info(f"🔄 [OpenRouter Structured] Starting request - Model: {payload['model']}")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url, json=payload, headers=self._get_headers(), timeout=60.0
-            )
-            response.raise_for_status()
+        client = self._get_http_client()
+        response = await client.post(url, json=payload, headers=self._get_headers(), timeout=60.0)
+        response.raise_for_status()
 
-            data = response.json()
+        data = response.json()
 
-            await self._log_structured_response(data, message_instance)
+        await self._log_structured_response(data, message_instance)
 
-            content = data["choices"][0]["message"]["content"]
+        content = data["choices"][0]["message"]["content"]
 
-            try:
-                parsed_response = json.loads(content)
-                logger.info(
-                    f"[OpenRouter Structured] Success - Tokens: {data.get('usage', {}).get('total_tokens', 0)}"
-                )
-                return parsed_response
-            except json.JSONDecodeError as e:
-                logger.error(f"[OpenRouter Structured] JSON parse failed: {content}")
-                raise ValueError(f"Invalid JSON response from model: {e}")
+        try:
+            parsed_response = json.loads(content)
+            logger.info(
+                f"[OpenRouter Structured] Success - Tokens: {data.get('usage', {}).get('total_tokens', 0)}"
+            )
+            return parsed_response
+        except json.JSONDecodeError as e:
+            logger.error(f"[OpenRouter Structured] JSON parse failed: {content}")
+            raise ValueError(f"Invalid JSON response from model: {e}")
 
     async def _log_structured_response(self, data: dict, message_instance=None):
         """Extract and log metrics from structured output response"""
@@ -379,9 +413,16 @@ class OpenRouterService(AIServiceBase):
             if cached_models:
                 return cached_models
 
-        url = f"{self.base_url}/models"
+        # Concurrent misses wait for a single fetch instead of each calling OpenRouter
+        async with self._get_models_lock():
+            if use_cache:
+                cached_models = cache.get(self.MODELS_CACHE_KEY)
+                if cached_models:
+                    return cached_models
+
+            url = f"{self.base_url}/models"
 
-        async with httpx.AsyncClient() as client:
+            client = self._get_http_client()
             response = await client.get(url, headers=self._get_headers(), timeout=30.0)
             response.raise_for_status()
 
@@ -389,6 +430,8 @@ class OpenRouterService(AIServiceBase):
 
             if use_cache:
                 cache.set(self.MODELS_CACHE_KEY, models_data, self.CACHE_TIMEOUT)
+                cache.delete(self.VALID_MODEL_IDS_CACHE_KEY)
+            self.bump_catalog_version()
 
             return models_data
 
@@ -460,6 +503,11 @@ class OpenRouterService(AIServiceBase):
         Get a set of all valid model IDs for validation purposes
         Uses cached data from get_all_models_flat
         """
+        if use_cache:
+            cached_ids = cache.get(self.VALID_MODEL_IDS_CACHE_KEY)
+            if cached_ids:
+                return cached_ids
+
         all_models = await self.get_all_models_flat(use_cache=use_cache)
         model_ids: set[str] = set()
 
@@ -468,6 +516,9 @@ class OpenRouterService(AIServiceBase):
             if model_id and isinstance(model_id, str):
                 model_ids.add(model_id)
 
+        if use_cache:
+            cache.set(self.VALID_MODEL_IDS_CACHE_KEY, model_ids, self.CACHE_TIMEOUT)
+
         return model_ids
 
     async def validate_model_id(self, model_id: str, use_cache: bool = True) -> bool:
@@ -554,16 +605,18 @@ class OpenRouterService(AIServiceBase):
         cache.delete(self.MODELS_CACHE_KEY)
         cache.delete(self.STRUCTURED_MODELS_CACHE_KEY)
         cache.delete(self.IMAGE_GEN_MODELS_CACHE_KEY)
+        cache.delete(self.VALID_MODEL_IDS_CACHE_KEY)
+        self.bump_catalog_version()
 
     async def providers(self) -> list[dict]:
         url = f"{self.base_url}/providers"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
-            response.raise_for_status()
+        client = self._get_http_client()
+        response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+        response.raise_for_status()
 
-            data = response.json()
-            return data.get("data", [])
+        data = response.json()
+        return data.get("data", [])
 
     @classmethod
     def validate_aspect_ratio(cls, aspect_ratio: str) -> bool:
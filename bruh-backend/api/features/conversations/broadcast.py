@@ -1,9 +1,12 @@
+import json
 import logging
 from uuid import UUID
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
+from api.features.users.consumers import user_channel
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,16 +22,19 @@ class ConversationBroadcaster:
             logger.error("Channel Layer was none. Not broadcasting update.")
             return
 
-        message = {
-            "type": "conversation_update",  # Method name on consumer
-            "update_type": update_type,
+        payload = {
+            "type": update_type,
+            "conversation_id": str(conversation_id) if conversation_id else None,
             "data": data,
         }
 
-        if conversation_id:
-            message["conversation_id"] = str(conversation_id)
+        # Encode once here so every socket in the group sends the same text
+        message = {
+            "type": "conversation_update",  # Method name on consumer
+            "text": json.dumps(payload),
+        }
 
-        async_to_sync(channel_layer.group_send)(f"user_{user_id}", message)
+        async_to_sync(channel_layer.group_send)(user_channel(user_id), message)
 
     @staticmethod
     def broadcast_title_update(user_id: int, conversation_id: UUID, new_title: str):
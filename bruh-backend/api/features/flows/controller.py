@@ -55,7 +55,9 @@ class FlowController:
         except QuotaExceededException as e:
             return 400, {"detail": str(e)}
 
-        validation = await FlowValidationService.validate_flow(nodes=data.nodes, edges=data.edges)
+        validation = await FlowValidationService.validate_flow_models(
+            nodes=data.nodes, edges=data.edges
+        )
 
         if not validation.valid:
             return 400, {
@@ -75,7 +77,7 @@ class FlowController:
         flow = await sync_to_async(lambda: get_object_or_404(Flow, id=flow_id, user=request.user))()
 
         if data.nodes is not None or data.edges is not None:
-            validation = await FlowValidationService.validate_flow(
+            validation = await FlowValidationService.validate_flow_raw(
                 nodes=data.nodes or flow.flow_data.get("nodes", []),
                 edges=data.edges or flow.flow_data.get("edges", []),
             )
@@ -122,7 +124,7 @@ class FlowController:
         """Validate a flow's structure and configuration"""
         flow = await sync_to_async(lambda: get_object_or_404(Flow, id=flow_id, user=request.user))()
 
-        return await FlowValidationService.validate_flow(
+        return await FlowValidationService.validate_flow_raw(
             nodes=flow.flow_data.get("nodes", []),
             edges=flow.flow_data.get("edges", []),
         )
@@ -134,9 +136,13 @@ class FlowController:
         flow_id: UUID,
         limit: int = 10,
         status: Optional[str] = None,
+        results_limit: int = 50,
     ):
+        """List recent executions; each carries only its last results_limit node results"""
         flow = await sync_to_async(lambda: get_object_or_404(Flow, id=flow_id, user=request.user))()
-        return await FlowService.get_flow_executions(flow=flow, limit=limit, status=status)
+        return await FlowService.get_flow_executions(
+            flow=flow, limit=limit, status=status, results_limit=results_limit
+        )
 
     @route.post(
         "/{flow_id}/execute",
@@ -146,7 +152,7 @@ class FlowController:
         """Execute a flow in the background"""
         flow = await sync_to_async(lambda: get_object_or_404(Flow, id=flow_id, user=request.user))()
 
-        validation = await FlowValidationService.validate_flow(
+        validation = await FlowValidationService.validate_flow_raw(
             nodes=flow.flow_data.get("nodes", []),
             edges=flow.flow_data.get("edges", []),
         )
@@ -172,7 +178,7 @@ class FlowController:
         execution.celery_task_id = task.id
         await sync_to_async(execution.save)(update_fields=["celery_task_id"])
 
-        return 202, await FlowService.execution_to_response(execution)
+        return 202, FlowService.execution_to_response(execution)
 
 
 @api_controller("/flow-templates", auth=JWTAuth(), tags=["Flow Templates"])
@@ -231,7 +237,7 @@ class FlowExecutionController:
             )
         )()
 
-        return 200, await FlowService.execution_to_response(execution)
+        return 200, FlowService.execution_to_response(execution)
 
     @route.post("/{execution_id}/cancel", response={200: dict, 400: dict, 404: dict})
     async def cancel_execution(self, request, execution_id: UUID):
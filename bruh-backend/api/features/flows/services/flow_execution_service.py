@@ -1,7 +1,6 @@
 import asyncio
 import logging
 from datetime import datetime
-from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from asgiref.sync import sync_to_async
@@ -682,6 +681,8 @@ class FlowExecutionService:
         return log
 
 
-@lru_cache()
+_FLOW_EXECUTION_SERVICE = FlowExecutionService()
+
+
 def get_flow_execution_service() -> FlowExecutionService:
-    return FlowExecutionService()
+    return _FLOW_EXECUTION_SERVICE
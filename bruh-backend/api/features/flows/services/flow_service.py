@@ -1,5 +1,6 @@
-from functools import lru_cache
+from datetime import datetime
 from typing import List, Optional, Tuple
+from uuid import UUID
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import User
@@ -26,21 +27,25 @@ class FlowService:
         search: Optional[str] = None,
     ) -> PaginatedFlowList:
         base_queryset = Flow.objects.filter(user=user)
-        total_flows = await sync_to_async(base_queryset.count)()
+
+        search = search.strip() if search else None
 
         queryset = base_queryset
         if search:
             queryset = queryset.filter(Q(name__icontains=search) | Q(description__icontains=search))
 
-        total = await sync_to_async(queryset.count)()
-
         offset = (page - 1) * page_size
-        has_next = total > (page * page_size)
-        has_prev = page > 1
+        # annotate only the page query; the counts stay plain COUNT(*) without the join
+        page_queryset = queryset.annotate(execution_count=Count("executions"))
 
-        queryset = queryset.annotate(execution_count=Count("executions"))
+        # sync_to_async shares one thread per request, so these run one after another anyway
+        total_flows = await sync_to_async(base_queryset.count)()
+        total = await sync_to_async(queryset.count)() if search else total_flows
+        flows = await sync_to_async(list)(page_queryset[offset : offset + page_size])
+        profile = await sync_to_async(lambda: user.profile)()
 
-        flows = await sync_to_async(list)(queryset[offset : offset + page_size])
+        has_next = total > (page * page_size)
+        has_prev = page > 1
 
         items = [
             FlowListItem(
@@ -55,8 +60,6 @@ class FlowService:
             for flow in flows
         ]
 
-        profile = await sync_to_async(lambda: user.profile)()
-
         return PaginatedFlowList(
             items=items,
             total=total,
@@ -71,11 +74,8 @@ class FlowService:
     @staticmethod
     async def create_flow(user: User, data: FlowCreate) -> Tuple[Optional[Flow], Optional[str]]:
         try:
-            flow_data = {
-                "nodes": [node.model_dump() for node in data.nodes],
-                "edges": [edge.model_dump() for edge in data.edges],
-                "variables": data.variables,
-            }
+            flow_data = data.model_dump(include={"nodes", "edges"})
+            flow_data["variables"] = data.variables
 
             flow = await sync_to_async(Flow.objects.create)(
                 user=user,
@@ -99,16 +99,12 @@ class FlowService:
             if "description" in data_dict:
                 flow.description = data_dict["description"]
 
-            flow_data = flow.flow_data.copy()
-
-            if "nodes" in data_dict:
-                flow_data["nodes"] = [node for node in data_dict["nodes"]]
-            if "edges" in data_dict:
-                flow_data["edges"] = [edge for edge in data_dict["edges"]]
-            if "variables" in data_dict:
-                flow_data["variables"] = data_dict["variables"]
+            flow_data_updates = {
+                key: data_dict[key] for key in ("nodes", "edges", "variables") if key in data_dict
+            }
+            if flow_data_updates:
+                flow.flow_data = {**flow.flow_data, **flow_data_updates}
 
-            flow.flow_data = flow_data
             flow.version += 1
 
             await sync_to_async(flow.save)()
@@ -124,7 +120,7 @@ class FlowService:
             user=user,
             name=f"{source_flow.name} (Copy)",
             description=source_flow.description,
-            flow_data=source_flow.flow_data.copy(),
+            flow_data=source_flow.flow_data,
         )
 
         return duplicate
@@ -150,34 +146,96 @@ class FlowService:
         flow: Flow,
         limit: int = 10,
         status: Optional[str] = None,
+        results_limit: Optional[int] = 50,
     ) -> List[FlowExecutionResponse]:
         queryset = flow.executions.all()
 
         if status:
             queryset = queryset.filter(status=status)
 
-        executions = await sync_to_async(list)(queryset[:limit])
+        executions = await sync_to_async(list)(
+            queryset.values(
+                "id",
+                "status",
+                "start_time",
+                "end_time",
+                "total_execution_time",
+                "execution_data",
+            )[:limit]
+        )
 
-        return [await FlowService.execution_to_response(execution) for execution in executions]
+        flow_id = str(flow.id)
+        return [
+            FlowService._build_execution_response(
+                flow_id=flow_id,
+                execution_id=execution["id"],
+                status=execution["status"],
+                start_time=execution["start_time"],
+                end_time=execution["end_time"],
+                total_execution_time=execution["total_execution_time"],
+                execution_data=execution["execution_data"],
+                results_limit=results_limit,
+            )
+            for execution in executions
+        ]
 
     @staticmethod
-    async def execution_to_response(execution: FlowExecution) -> FlowExecutionResponse:
-        execution_data = execution.execution_data
-        node_results = execution_data.get("nodeResults", [])
+    def execution_to_response(
+        execution: FlowExecution,
+        flow_id: Optional[str] = None,
+        *,
+        results_limit: Optional[int] = None,
+    ) -> FlowExecutionResponse:
+        return FlowService._build_execution_response(
+            flow_id=flow_id or str(execution.flow_id),
+            execution_id=execution.id,
+            status=execution.status,
+            start_time=execution.start_time,
+            end_time=execution.end_time,
+            total_execution_time=execution.total_execution_time,
+            execution_data=execution.execution_data,
+            results_limit=results_limit,
+        )
+
+    @staticmethod
+    def _build_execution_response(
+        *,
+        flow_id: str,
+        execution_id: UUID,
+        status: str,
+        start_time: datetime,
+        end_time: Optional[datetime],
+        total_execution_time: Optional[int],
+        execution_data: Optional[dict],
+        results_limit: Optional[int],
+    ) -> FlowExecutionResponse:
+        """Shared by model instances and values() rows so the field mapping lives in one place"""
+        execution_data = execution_data or {}
+        node_results = FlowService._tail_node_results(execution_data, results_limit)
 
         return FlowExecutionResponse(
-            flowId=str(execution.flow.id),
-            executionId=str(execution.id),
-            status=execution.status,
-            startTime=execution.start_time,
-            endTime=execution.end_time,
-            totalExecutionTime=execution.total_execution_time,
+            flowId=flow_id,
+            executionId=str(execution_id),
+            status=status,
+            startTime=start_time,
+            endTime=end_time,
+            totalExecutionTime=total_execution_time,
             nodeResults=[NodeExecutionResult(**result) for result in node_results],
             finalOutput=execution_data.get("finalOutput"),
             error=execution_data.get("error"),
         )
 
+    @staticmethod
+    def _tail_node_results(execution_data: dict, results_limit: Optional[int]) -> list:
+        """Most recent node results, capped at results_limit (None keeps them all)"""
+        node_results = execution_data.get("nodeResults", [])
+        if results_limit is not None and len(node_results) > results_limit:
+            return node_results[-results_limit:] if results_limit > 0 else []
+        return node_results
+
+
+_FLOW_SERVICE = FlowService()
+
 
-@lru_cache()
 def get_flow_service() -> FlowService:
-    return FlowService()
+    return _FLOW_SERVICE
@@ -1,28 +1,75 @@
+import hashlib
 import logging
-from functools import lru_cache
-from typing import Any, Dict, List, Set
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Callable, DefaultDict, Dict, FrozenSet, List, Set
 
 from ..schemas import (
     FlowEdge,
     FlowNode,
     FlowValidationResult,
+    InputNodeData,
+    JsonExtractorNodeData,
+    LLMNodeData,
+    OutputNodeData,
     ValidationError,
 )
 
 logger = logging.getLogger(__name__)
 
+VALIDATION_CACHE_SIZE = 256
+
+# standalone input/output nodes are not reported as disconnected
+_IO_TYPES = frozenset({"input", "output"})
+
 
 class FlowValidationService:
+    # digest of (nodes, edges) -> result, most recently used last
+    _result_cache: "OrderedDict[bytes, FlowValidationResult]" = OrderedDict()
+
+    @staticmethod
+    async def validate_flow_raw(nodes: List[Any], edges: List[Any]) -> FlowValidationResult:
+        """Validate nodes/edges as stored in flow_data (plain dicts); parsed models pass through"""
+        return await FlowValidationService.validate_flow_models(
+            nodes=[FlowNode.model_validate(node) for node in nodes],
+            edges=[FlowEdge.model_validate(edge) for edge in edges],
+        )
+
     @staticmethod
-    async def validate_flow(nodes: List[Any], edges: List[Any]) -> FlowValidationResult:
+    async def validate_flow_models(
+        nodes: List[FlowNode], edges: List[FlowEdge]
+    ) -> FlowValidationResult:
+        cache = FlowValidationService._result_cache
+        key = FlowValidationService._flow_digest(nodes, edges)
+
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached.model_copy(deep=True)
+
+        result = FlowValidationService._validate_flow_core(nodes, edges)
+
+        cache[key] = result.model_copy(deep=True)
+        if len(cache) > VALIDATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def _flow_digest(nodes: List[FlowNode], edges: List[FlowEdge]) -> bytes:
+        """Stable digest of a flow's structure, used as the validation cache key"""
+        hasher = hashlib.blake2b(digest_size=16)
+        for node in nodes:
+            hasher.update(node.model_dump_json().encode())
+        hasher.update(b"\x00")
+        for edge in edges:
+            hasher.update(edge.model_dump_json().encode())
+        return hasher.digest()
+
+    @staticmethod
+    def _validate_flow_core(nodes: List[FlowNode], edges: List[FlowEdge]) -> FlowValidationResult:
         errors: List[ValidationError] = []
         warnings: List[str] = []
 
-        if nodes and isinstance(nodes[0], dict):
-            nodes = [FlowNode(**node) for node in nodes]
-        if edges and isinstance(edges[0], dict):
-            edges = [FlowEdge(**edge) for edge in edges]
-
         if not nodes:
             errors.append(
                 ValidationError(
@@ -33,13 +80,11 @@ class FlowValidationService:
             )
             return FlowValidationResult(valid=False, errors=errors)
 
-        node_ids: Set[str] = set()
         node_types: Dict[str, str] = {}
         input_nodes: List[str] = []
         output_nodes: List[str] = []
 
         for node in nodes:
-            node_ids.add(node.id)
             node_types[node.id] = node.type
 
             if node.type == "input":
@@ -65,8 +110,17 @@ class FlowValidationService:
                 )
             )
 
+        node_ids: FrozenSet[str] = frozenset(node_types)
+        is_node = node_ids.__contains__
+
+        graph: DefaultDict[str, List[str]] = defaultdict(list)
+        connected_nodes: Set[str] = set()
+
         for edge in edges:
-            if edge.source not in node_ids:
+            source_exists = is_node(edge.source)
+            target_exists = is_node(edge.target)
+
+            if not source_exists:
                 errors.append(
                     ValidationError(
                         nodeId=edge.source,
@@ -75,7 +129,7 @@ class FlowValidationService:
                     )
                 )
 
-            if edge.target not in node_ids:
+            if not target_exists:
                 errors.append(
                     ValidationError(
                         nodeId=edge.target,
@@ -84,22 +138,23 @@ class FlowValidationService:
                     )
                 )
 
-        for node in nodes:
-            node_errors = FlowValidationService._validate_node(node)
-            errors.extend(node_errors)
+            if source_exists and target_exists:
+                graph[edge.source].append(edge.target)
 
-        connected_nodes = set()
-        for edge in edges:
             connected_nodes.add(edge.source)
             connected_nodes.add(edge.target)
 
-        disconnected = node_ids - connected_nodes
-        if disconnected:
-            for node_id in disconnected:
-                if node_types.get(node_id) not in ["input", "output"]:
-                    warnings.append(f"Node '{node_id}' is not connected to any other nodes")
+        for node in nodes:
+            node_errors = FlowValidationService._validate_node(node)
+            errors.extend(node_errors)
 
-        if FlowValidationService._has_cycle(nodes, edges):
+        io_nodes = {node_id for node_id, node_type in node_types.items() if node_type in _IO_TYPES}
+        disconnected = node_ids - connected_nodes - io_nodes
+        warnings.extend(
+            f"Node '{node_id}' is not connected to any other nodes" for node_id in disconnected
+        )
+
+        if FlowValidationService._has_cycle(graph, node_ids):
             errors.append(
                 ValidationError(
                     nodeId="",
@@ -116,133 +171,146 @@ class FlowValidationService:
 
     @staticmethod
     def _validate_node(node: FlowNode) -> List[ValidationError]:
-        errors: List[ValidationError] = []
+        validator = _NODE_VALIDATORS.get(type(node.data))
+        return validator(node) if validator else []
 
-        if node.type == "input":
-            if not getattr(node.data, "value", None) and not getattr(
-                node.data, "variableName", None
-            ):
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="value",
-                        message="Input node must have either a value or variable name",
-                    )
-                )
+    @staticmethod
+    def _has_cycle(graph: Dict[str, List[str]], node_ids: FrozenSet[str]) -> bool:
+        """Kahn's algorithm: the graph has a cycle iff a topological sort can't consume every node"""
+        indegree: Dict[str, int] = dict.fromkeys(node_ids, 0)
+        for targets in graph.values():
+            for target in targets:
+                indegree[target] += 1
+
+        queue = deque(node_id for node_id, degree in indegree.items() if degree == 0)
+        processed = 0
+
+        while queue:
+            node_id = queue.popleft()
+            processed += 1
+            for neighbor in graph.get(node_id, ()):
+                indegree[neighbor] -= 1
+                if indegree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        return processed != len(indegree)
+
+
+def _validate_input_node(node: FlowNode) -> List[ValidationError]:
+    data: InputNodeData = node.data
+    if not data.value and not data.variableName:
+        return [
+            ValidationError(
+                nodeId=node.id,
+                field="value",
+                message="Input node must have either a value or variable name",
+            )
+        ]
+    return []
 
-        elif node.type == "llm":
-            if not getattr(node.data, "provider", None):
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="provider",
-                        message="LLM node must specify a provider",
-                    )
-                )
 
-            if not getattr(node.data, "model", None):
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="model",
-                        message="LLM node must specify a model",
-                    )
-                )
+def _validate_llm_node(node: FlowNode) -> List[ValidationError]:
+    data: LLMNodeData = node.data
+    errors: List[ValidationError] = []
 
-            if not getattr(node.data, "userPromptTemplate", None):
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="userPromptTemplate",
-                        message="LLM node must have a prompt template",
-                    )
-                )
+    if not data.provider:
+        errors.append(
+            ValidationError(
+                nodeId=node.id,
+                field="provider",
+                message="LLM node must specify a provider",
+            )
+        )
 
-            temp = getattr(node.data, "temperature", 1.0)
-            if not (0.0 <= temp <= 2.0):
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="temperature",
-                        message="Temperature must be between 0.0 and 2.0",
-                    )
-                )
+    if not data.model:
+        errors.append(
+            ValidationError(
+                nodeId=node.id,
+                field="model",
+                message="LLM node must specify a model",
+            )
+        )
 
-        elif node.type == "json_extractor":
-            extractions = getattr(node.data, "extractions", [])
+    if not data.userPromptTemplate:
+        errors.append(
+            ValidationError(
+                nodeId=node.id,
+                field="userPromptTemplate",
+                message="LLM node must have a prompt template",
+            )
+        )
 
-            if not extractions:
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="extractions",
-                        message="JSON extractor must have at least one extraction defined",
-                    )
-                )
+    if not (0.0 <= data.temperature <= 2.0):
+        errors.append(
+            ValidationError(
+                nodeId=node.id,
+                field="temperature",
+                message="Temperature must be between 0.0 and 2.0",
+            )
+        )
 
-            for idx, extraction in enumerate(extractions):
-                if isinstance(extraction, dict):
-                    if not extraction.get("key"):
-                        errors.append(
-                            ValidationError(
-                                nodeId=node.id,
-                                field=f"extractions[{idx}].key",
-                                message="Each extraction must have a key",
-                            )
-                        )
-
-                    if not extraction.get("path"):
-                        errors.append(
-                            ValidationError(
-                                nodeId=node.id,
-                                field=f"extractions[{idx}].path",
-                                message="Each extraction must have a path",
-                            )
-                        )
-
-        elif node.type == "output":
-            if not getattr(node.data, "format", None):
-                errors.append(
-                    ValidationError(
-                        nodeId=node.id,
-                        field="format",
-                        message="Output node must specify a format",
-                    )
+    return errors
+
+
+def _validate_json_extractor_node(node: FlowNode) -> List[ValidationError]:
+    data: JsonExtractorNodeData = node.data
+    errors: List[ValidationError] = []
+
+    if not data.extractions:
+        errors.append(
+            ValidationError(
+                nodeId=node.id,
+                field="extractions",
+                message="JSON extractor must have at least one extraction defined",
+            )
+        )
+
+    for idx, extraction in enumerate(data.extractions):
+        if not extraction.key:
+            errors.append(
+                ValidationError(
+                    nodeId=node.id,
+                    field=f"extractions[{idx}].key",
+                    message="Each extraction must have a key",
                 )
+            )
 
-        return errors
+        if not extraction.path:
+            errors.append(
+                ValidationError(
+                    nodeId=node.id,
+                    field=f"extractions[{idx}].path",
+                    message="Each extraction must have a path",
+                )
+            )
 
-    @staticmethod
-    def _has_cycle(nodes: List[FlowNode], edges: List[FlowEdge]) -> bool:
-        graph: Dict[str, List[str]] = {node.id: [] for node in nodes}
-        for edge in edges:
-            graph[edge.source].append(edge.target)
+    return errors
 
-        visited = set()
-        rec_stack = set()
 
-        def dfs(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
+def _validate_output_node(node: FlowNode) -> List[ValidationError]:
+    data: OutputNodeData = node.data
+    if not data.format:
+        return [
+            ValidationError(
+                nodeId=node.id,
+                field="format",
+                message="Output node must specify a format",
+            )
+        ]
+    return []
 
-            for neighbor in graph.get(node_id, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
 
-            rec_stack.remove(node_id)
-            return False
+# node.data is a discriminated union, so its class identifies the node type
+_NODE_VALIDATORS: Dict[type, Callable[[FlowNode], List[ValidationError]]] = {
+    InputNodeData: _validate_input_node,
+    LLMNodeData: _validate_llm_node,
+    JsonExtractorNodeData: _validate_json_extractor_node,
+    OutputNodeData: _validate_output_node,
+}
 
-        for node in nodes:
-            if node.id not in visited:
-                if dfs(node.id):
-                    return True
 
-        return False
+_FLOW_VALIDATION_SERVICE = FlowValidationService()
 
 
-@lru_cache()
 def get_flow_validation_service() -> FlowValidationService:
-    return FlowValidationService()
+    return _FLOW_VALIDATION_SERVICE
@@ -1,4 +1,3 @@
-from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 from uuid import uuid4
 
@@ -31,6 +30,8 @@ class NodeTemplateService:
             return None, str(e)
 
 
-@lru_cache
+_NODE_TEMPLATE_SERVICE = NodeTemplateService()
+
+
 def get_node_template_service() -> NodeTemplateService:
-    return NodeTemplateService()
+    return _NODE_TEMPLATE_SERVICE
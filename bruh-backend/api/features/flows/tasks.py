@@ -1,7 +1,11 @@
+import json
 import logging
 
 from asgiref.sync import async_to_sync
+from django.db.models import F, Func, JSONField, Value
+from django.db.models.functions import Now
 
+from api.features.ai.services.factory import close_ai_services
 from config.celery import app
 
 from .models import FlowExecution
@@ -10,16 +14,40 @@ from .services.flow_execution_service import FlowExecutionService
 logger = logging.getLogger(__name__)
 
 
+async def _execute_flow(execution: FlowExecution):
+    try:
+        await FlowExecutionService.execute_flow_async(execution)
+    finally:
+        # async_to_sync runs each task on a fresh loop that is closed afterwards, and pooled
+        # connections can only be closed on the loop that opened them
+        await close_ai_services()
+
+
 @app.task(bind=True, max_retries=3)
 def execute_flow_task(self, execution_id: str):
     try:
         logger.info(f"Starting flow execution: {execution_id}")
 
-        execution = FlowExecution.objects.select_related("flow", "user").get(id=execution_id)
+        # the executor never touches execution.user or the flow's metadata columns
+        execution = (
+            FlowExecution.objects.select_related("flow")
+            .only(
+                "id",
+                "flow",
+                "status",
+                "start_time",
+                "end_time",
+                "total_execution_time",
+                "execution_data",
+                "flow__id",
+                "flow__flow_data",
+            )
+            .get(id=execution_id)
+        )
 
-        async_to_sync(FlowExecutionService.execute_flow_async)(execution)
+        async_to_sync(_execute_flow)(execution)
 
-        execution.refresh_from_db()
+        execution.refresh_from_db(fields=["status"])
 
         logger.info(f"Completed flow execution: {execution_id} with status: {execution.status}")
         return {
@@ -35,12 +63,22 @@ def execute_flow_task(self, execution_id: str):
         logger.exception(f"Flow execution failed: {execution_id}")
 
         try:
-            execution = FlowExecution.objects.get(id=execution_id)
-            execution.status = "failed"
-            if not execution.execution_data:
-                execution.execution_data = {}
-            execution.execution_data["error"] = str(e)
-            execution.save()
+            error = {"message": str(e), "type": type(e).__name__}
+
+            # One UPDATE: the error is merged into execution_data in SQL, so node results
+            # written so far are kept without reading the row first. The API reads "error".
+            FlowExecution.objects.filter(id=execution_id).update(
+                status="failed",
+                end_time=Now(),
+                error_message=str(e),
+                execution_data=Func(
+                    F("execution_data"),
+                    Value("$.error"),
+                    Func(Value(json.dumps(error)), function="JSON"),
+                    function="JSON_SET",
+                    output_field=JSONField(),
+                ),
+            )
         except Exception:
             pass
 
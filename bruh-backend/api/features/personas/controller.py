@@ -2,10 +2,10 @@ import logging
 from typing import List
 from uuid import UUID
 
-from asgiref.sync import sync_to_async
 from ninja import File, UploadedFile
 from ninja_extra import api_controller, route
-from ninja_jwt.authentication import JWTAuth
+
+from api.features.users.authentication import ProfileJWTAuth
 
 from .schemas import (
     DeleteResponseSchema,
@@ -19,7 +19,7 @@ from .services import get_persona_service
 logger = logging.getLogger(__name__)
 
 
-@api_controller("/personas", auth=JWTAuth(), tags=["Personas"])
+@api_controller("/personas", auth=ProfileJWTAuth(), tags=["Personas"])
 class PersonaController:
     @route.get("/", response=List[PersonaOutSchema])
     async def get_personas(self, request):
@@ -53,11 +53,7 @@ class PersonaController:
         """
         user = request.auth
 
-        @sync_to_async
-        def get_user_profile():
-            return user.profile
-
-        profile = await get_user_profile()
+        profile = user.profile
 
         if not profile.default_aux_model:
             return {
@@ -68,6 +64,13 @@ class PersonaController:
         aux_model = profile.default_aux_model
         aux_provider = profile.default_provider or "openrouter"
 
+        # The stored flag was computed against the aux model's own provider
+        supports_structured = (
+            profile.default_aux_model_supports_structured
+            if profile.default_aux_model_provider == aux_provider
+            else None
+        )
+
         try:
             persona_service = get_persona_service()
 
@@ -76,11 +79,12 @@ class PersonaController:
                 request_data=data,
                 aux_model=aux_model,
                 aux_provider=aux_provider,
+                supports_structured=supports_structured,
             )
 
-            @sync_to_async
-            def serialize_persona():
-                return {
+            return {
+                "success": True,
+                "persona": {
                     "id": str(persona.id),
                     "name": persona.name,
                     "description": persona.description,
@@ -93,13 +97,7 @@ class PersonaController:
                     "is_public": persona.is_public,
                     "is_active": persona.is_active,
                     "owner_username": user.username,
-                }
-
-            persona_dict = await serialize_persona()
-
-            return {
-                "success": True,
-                "persona": persona_dict,
+                },
                 "reasoning": reasoning,
                 "message": f"Successfully generated persona '{persona.name}'",
             }
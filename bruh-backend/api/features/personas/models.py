@@ -54,6 +54,9 @@ class Persona(models.Model):
     class Meta:
         verbose_name = "Persona"
         verbose_name_plural = "Personas"
+        indexes = [
+            models.Index(fields=["user", "deleted"]),
+        ]
 
     def __str__(self):
         return f"{self.name} by {self.user.username}"
@@ -50,9 +50,15 @@ class PersonaOutSchema(ModelSchema):
     @staticmethod
     def resolve_owner_username(obj, context):
         request = context.get("request")
-        if request and obj.user:
-            return obj.user.username
-        return None
+        if not request or obj.user_id is None:
+            return None
+
+        # personas are almost always listed for their owner, so avoid loading obj.user per row
+        auth_user = getattr(request, "auth", None)
+        if auth_user is not None and auth_user.pk == obj.user_id:
+            return auth_user.username
+
+        return obj.user.username
 
     @staticmethod
     def resolve_persona_image(obj):
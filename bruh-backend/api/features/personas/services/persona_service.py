@@ -1,12 +1,17 @@
-import datetime
 import logging
 from functools import lru_cache
+from typing import Optional
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
 from django.core.files.uploadedfile import UploadedFile
+from django.utils import timezone
 
-from api.features.ai.services.factory import get_ai_service
+from api.features.ai.services.factory import (
+    get_ai_service,
+    supports_structured_outputs_cached,
+    validate_model_id_cached,
+)
 
 from ..models import Persona
 from ..schemas import (
@@ -17,12 +22,78 @@ from ..schemas import (
 
 logger = logging.getLogger(__name__)
 
+_PERSONA_SYSTEM_PROMPT = """You are an expert AI persona designer. Your task is to create a detailed AI persona based on the user's description.
+
+The persona should be designed to work with {target_provider} as its provider.
+
+Create a persona with:
+- A short, memorable name (2-4 words)
+- A clear description of what the persona is about
+- Detailed instructions on how the AI should behave, speak, and interact
+- Example dialogue showing the persona's style (at least 3 exchanges)
+- A reasoning explanation of your design choices
+
+Make the persona engaging, consistent, and true to the user's vision."""
+
+_PERSONA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "A short, memorable name for the persona (2-4 words)",
+        },
+        "description": {
+            "type": "string",
+            "description": "A brief description of what this persona is about",
+        },
+        "instructions": {
+            "type": "string",
+            "description": "Detailed instructions for the LLM on how to behave as this persona",
+        },
+        "example_dialogue": {
+            "type": "string",
+            "description": "Example dialogue showing the persona's style and responses (at least 3 exchanges)",
+        },
+        "reasoning": {
+            "type": "string",
+            "description": "Explanation of the design choices made for this persona",
+        },
+    },
+    "required": ["name", "description", "instructions", "example_dialogue"],
+}
+
+_PERSONA_SCHEMA_OPENROUTER = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "persona_generation",
+        "strict": True,
+        "schema": _PERSONA_SCHEMA,
+    },
+}
+
+# Columns PersonaOutSchema serializes, plus the owner id its resolver checks
+_PERSONA_LIST_COLUMNS = (
+    "id",
+    "user",
+    "name",
+    "description",
+    "instructions",
+    "example_dialogue",
+    "model_id",
+    "provider",
+    "created_at",
+    "updated_at",
+    "is_public",
+    "is_active",
+    "persona_image",
+)
+
 
 class PersonaService:
     @staticmethod
     @sync_to_async
     def get_user_personas(user, include_deleted=False):
-        queryset = Persona.objects.filter(user=user)
+        queryset = Persona.objects.filter(user=user).only(*_PERSONA_LIST_COLUMNS)
         if not include_deleted:
             queryset = queryset.filter(deleted=False)
         return list(queryset)
@@ -69,24 +140,29 @@ class PersonaService:
             if not valid_model_id:
                 raise ValueError(f"Invalid model ID: {data.model_id}")
 
-        for attr, value in data.dict(exclude_unset=True).items():
-            setattr(persona, attr, value)
+        # Every updatable field is a plain column, so write just the changed ones
+        # instead of a full save() of the row
+        changes = {field: getattr(data, field) for field in data.model_fields_set}
+        if changes:
+            changes["updated_at"] = timezone.now()
+            Persona.objects.filter(pk=persona.pk).update(**changes)
+
+            for attr, value in changes.items():
+                setattr(persona, attr, value)
 
-        persona.save()
         return persona
 
     @staticmethod
     @sync_to_async
     def delete_user_persona(user, persona_id):
-        persona = Persona.objects.filter(id=persona_id, user=user).first()
+        rows = Persona.objects.filter(id=persona_id, user=user, deleted=False).update(
+            deleted=True, deleted_at=timezone.now()
+        )
 
-        if persona is None:
+        # Already-deleted personas keep their deleted_at; a repeat DELETE still succeeds
+        if rows == 0 and not Persona.objects.filter(id=persona_id, user=user).exists():
             return False
 
-        persona.deleted = True
-        persona.deleted_at = datetime.datetime.now(datetime.timezone.utc)
-        persona.save(update_fields=["deleted", "deleted_at"])
-
         return {"message": "Persona deleted successfully"}
 
     @staticmethod
@@ -97,6 +173,7 @@ class PersonaService:
         aux_provider: str,
         target_provider: str = "openrouter",
         suggested_model: str = None,
+        supports_structured: Optional[bool] = None,
     ) -> dict:
         """
         Generate a persona using AI with structured output
@@ -108,10 +185,12 @@ class PersonaService:
             aux_provider: The provider for the aux model
             target_provider: The provider the persona will use (openrouter/ollama)
             suggested_model: Optional specific model for the persona to use
+            supports_structured: Known structured-output support of the aux model, checked if None
         """
         service = get_ai_service(aux_provider)
 
-        supports_structured = await service.supports_structured_outputs(aux_model, use_cache=True)
+        if supports_structured is None:
+            supports_structured = await supports_structured_outputs_cached(aux_provider, aux_model)
 
         if not supports_structured:
             raise ValueError(
@@ -119,18 +198,7 @@ class PersonaService:
                 "Please set a different default AUX model in your profile."
             )
 
-        system_prompt = f"""You are an expert AI persona designer. Your task is to create a detailed AI persona based on the user's description.
-
-The persona should be designed to work with {target_provider} as its provider.
-
-Create a persona with:
-- A short, memorable name (2-4 words)
-- A clear description of what the persona is about
-- Detailed instructions on how the AI should behave, speak, and interact
-- Example dialogue showing the persona's style (at least 3 exchanges)
-- A reasoning explanation of your design choices
-
-Make the persona engaging, consistent, and true to the user's vision."""
+        system_prompt = _PERSONA_SYSTEM_PROMPT.format(target_provider=target_provider)
 
         user_prompt = f"""Create an AI persona based on this description:
 
@@ -146,42 +214,9 @@ Generate a complete persona specification."""
             {"role": "user", "content": user_prompt},
         ]
 
-        response_schema = {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "A short, memorable name for the persona (2-4 words)",
-                },
-                "description": {
-                    "type": "string",
-                    "description": "A brief description of what this persona is about",
-                },
-                "instructions": {
-                    "type": "string",
-                    "description": "Detailed instructions for the LLM on how to behave as this persona",
-                },
-                "example_dialogue": {
-                    "type": "string",
-                    "description": "Example dialogue showing the persona's style and responses (at least 3 exchanges)",
-                },
-                "reasoning": {
-                    "type": "string",
-                    "description": "Explanation of the design choices made for this persona",
-                },
-            },
-            "required": ["name", "description", "instructions", "example_dialogue"],
-        }
-
-        if aux_provider == "openrouter":
-            response_schema = {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "persona_generation",
-                    "strict": True,
-                    "schema": response_schema,
-                },
-            }
+        response_schema = (
+            _PERSONA_SCHEMA_OPENROUTER if aux_provider == "openrouter" else _PERSONA_SCHEMA
+        )
 
         persona_data = await service.chat_with_structured_output(
             messages=messages,
@@ -192,7 +227,7 @@ Generate a complete persona specification."""
         target_service = get_ai_service(target_provider)
 
         if suggested_model:
-            is_valid = await target_service.validate_model_id(suggested_model)
+            is_valid = await validate_model_id_cached(target_provider, suggested_model)
             if not is_valid:
                 logger.warning(f"Suggested model {suggested_model} is invalid, using default")
                 model_id = target_service.default_model
@@ -217,6 +252,7 @@ Generate a complete persona specification."""
         request_data: PersonaGenerationRequestSchema,
         aux_model: str,
         aux_provider: str,
+        supports_structured: Optional[bool] = None,
     ) -> Persona:
         """
         Generate a persona with AI and create it in the database
@@ -229,6 +265,7 @@ Generate a complete persona specification."""
             aux_provider=aux_provider,
             target_provider=request_data.target_provider,
             suggested_model=request_data.suggested_model,
+            supports_structured=supports_structured,
         )
 
         # Create the persona
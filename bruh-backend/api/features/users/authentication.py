@@ -0,0 +1,27 @@
+from ninja_jwt.authentication import JWTAuth
+
+
+class _ProfileUserLookup:
+    """
+    Stands in for the user model inside JWTAuth.get_user so its
+    `user_model.objects.get(...)` lookup also joins the profile
+    """
+
+    def __init__(self, user_model):
+        self._user_model = user_model
+        self.objects = user_model.objects.select_related("profile")
+
+    def __getattr__(self, name):
+        return getattr(self._user_model, name)
+
+
+class ProfileJWTAuth(JWTAuth):
+    """
+    JWTAuth that loads the user's profile in the same query, so controllers
+    that read request.user.profile don't need another round-trip for it.
+    Token claim handling and the is_active check stay in ninja_jwt's get_user.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.user_model = _ProfileUserLookup(self.user_model)
@@ -1,8 +1,16 @@
 import json
+import sys
+from functools import lru_cache
 
 from channels.generic.websocket import AsyncWebsocketConsumer
 
 
+@lru_cache(maxsize=1024)
+def user_channel(user_id: int) -> str:
+    """Name of the channel group a user's sockets join"""
+    return sys.intern(f"user_{user_id}")
+
+
 class UserConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         user = self.scope.get("user")
@@ -12,7 +20,7 @@ class UserConsumer(AsyncWebsocketConsumer):
             return
 
         # Each user gets their own channel based on user ID
-        self.user_group_name = f"user_{user.id}"
+        self.user_group_name = user_channel(user.id)
 
         # Join user's personal group
         await self.channel_layer.group_add(self.user_group_name, self.channel_name)
@@ -26,6 +34,11 @@ class UserConsumer(AsyncWebsocketConsumer):
     # Receive different types of updates
     async def conversation_update(self, event):
         """Handle any conversation-related update"""
+        if "text" in event:
+            # Already encoded by the broadcaster
+            await self.send(text_data=event["text"])
+            return
+
         await self.send(
             text_data=json.dumps(
                 {
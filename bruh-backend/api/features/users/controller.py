@@ -1,18 +1,22 @@
 # api/features/users/controller.py
+import asyncio
 from typing import List, Optional
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import JsonResponse
 from ninja import File
 from ninja.files import UploadedFile
 from ninja_extra import api_controller, route
-from ninja_jwt.authentication import JWTAuth
 from ninja_jwt.tokens import RefreshToken
 
-from api.features.ai.services import get_ai_service
+from api.features.ai.services import supports_structured_outputs_cached, validate_model_id_cached
 
+from .authentication import ProfileJWTAuth
 from .models import Profile
 from .permissons import IsAdmin
 from .schemas import (
@@ -20,6 +24,7 @@ from .schemas import (
     BulkAddModelsSchema,
     BulkOperationResponseSchema,
     LoginSchema,
+    ProfileSchema,
     ProfileUpdateSchema,
     UserAddedModelSchema,
     UserQuotaUpdateSchema,
@@ -29,97 +34,137 @@ from .schemas import (
 )
 from .services.user_helper_service import UserHelperService
 
+_USER_FIELDS = tuple(field for field in UserSchema.model_fields if field != "profile")
+_PROFILE_FIELDS = tuple(field for field in ProfileSchema.model_fields if field != "profile_image")
+_USER_COLUMNS = (*_USER_FIELDS, *(f"profile__{field}" for field in ProfileSchema.model_fields))
 
-@api_controller("/users", auth=JWTAuth(), tags=["Users"])
-class UserController:
-    def _add_full_image_url(self, request, user):
-        if hasattr(user, "profile") and user.profile.profile_image:
-            user.profile._image_full_url = request.build_absolute_uri(
-                user.profile.profile_image.url
-            )
-        return user
 
+def _users_with_profile():
+    return User.objects.select_related("profile").only(*_USER_COLUMNS)
+
+
+def _user_to_dict(user) -> dict:
+    """
+    Build the UserSchema payload by hand so the read-only user endpoints can
+    skip ninja's per-object response validation
+    """
+    data = {field: getattr(user, field) for field in _USER_FIELDS}
+
+    profile = getattr(user, "profile", None)
+    if profile is None:
+        data["profile"] = None
+    else:
+        profile_data = {field: getattr(profile, field) for field in _PROFILE_FIELDS}
+        profile_data["profile_image"] = profile.profile_image.url if profile.profile_image else None
+        data["profile"] = profile_data
+
+    return data
+
+
+@api_controller("/users", auth=ProfileJWTAuth(), tags=["Users"])
+class UserController:
     @route.get("/me", response=UserSchema)
-    def get_current_user(self, request):
-        return request.user
+    async def get_current_user(self, request):
+        return JsonResponse(_user_to_dict(request.user))
 
     @route.patch("/me", response=UserSchema)
-    def update_current_user(self, request, data: UserUpdateSchema):
+    async def update_current_user(self, request, data: UserUpdateSchema):
         user = request.user
-        for attr, value in data.dict(exclude_unset=True).items():
-            setattr(user, attr, value)
-        user.save()
+        for attr in data.model_fields_set:
+            setattr(user, attr, getattr(data, attr))
+        if data.model_fields_set:
+            await user.asave(update_fields=data.model_fields_set)
 
         return request.user
 
     @route.patch("/me/profile", response={200: UserSchema, 400: dict})
     async def update_current_user_profile(self, request, data: ProfileUpdateSchema):
         user = request.user
-        profile: Profile = await sync_to_async(lambda: user.profile)()
-
-        data_dict = data.dict(exclude_unset=True)
+        profile: Profile = user.profile
 
-        provider = data_dict.get("default_provider", profile.default_provider)
-        if "default_model" in data_dict and data_dict["default_model"]:
-            service = get_ai_service(provider)
-            is_valid = await service.validate_model_id(data_dict["default_model"])
+        fields_set = data.model_fields_set
 
-            if not is_valid:
-                return 400, {
-                    "detail": f"Invalid model ID for {provider}: {data_dict['default_model']}"
-                }
+        provider = (
+            data.default_provider if "default_provider" in fields_set else profile.default_provider
+        )
+        aux_provider = (
+            data.default_aux_model_provider
+            if "default_aux_model_provider" in fields_set
+            else profile.default_aux_model_provider
+        )
 
-        aux_provider = data_dict.get(
-            "default_aux_model_provider", profile.default_aux_model_provider
+        # Unset fields are None, so these only fire for models the client sent
+        checks = []
+        if data.default_model:
+            checks.append(("Invalid model ID", provider, data.default_model))
+        if data.default_aux_model:
+            checks.append(("Invalid auxiliary model ID", aux_provider, data.default_aux_model))
+
+        results = await asyncio.gather(
+            *(
+                validate_model_id_cached(model_provider, model_id)
+                for _, model_provider, model_id in checks
+            )
         )
-        if "default_aux_model" in data_dict and data_dict["default_aux_model"]:
-            service = get_ai_service(aux_provider)
-            is_valid = await service.validate_model_id(data_dict["default_aux_model"])
 
+        for (message, model_provider, model_id), is_valid in zip(checks, results):
             if not is_valid:
-                return 400, {
-                    "detail": f"Invalid auxiliary model ID for {provider}: {data_dict['default_aux_model']}"
-                }
-
-        for attr, value in data_dict.items():
-            setattr(profile, attr, value)
+                return 400, {"detail": f"{message} for {model_provider}: {model_id}"}
+
+        update_fields = set(fields_set)
+        for attr in fields_set:
+            setattr(profile, attr, getattr(data, attr))
+
+        # Persona generation needs a structured-output aux model, so record it once here
+        if fields_set & {"default_aux_model", "default_aux_model_provider"}:
+            profile.default_aux_model_supports_structured = (
+                await supports_structured_outputs_cached(aux_provider, profile.default_aux_model)
+                if profile.default_aux_model and aux_provider
+                else None
+            )
+            update_fields.add("default_aux_model_supports_structured")
 
-        await sync_to_async(profile.save)()
+        if update_fields:
+            await profile.asave(update_fields=update_fields)
 
         return 200, request.user
 
     @route.post("/me/profile/image", response=UserSchema)
-    def update_profile_image(self, request, profile_image: UploadedFile = File(...)):  # type: ignore
+    async def update_profile_image(self, request, profile_image: UploadedFile = File(...)):  # type: ignore
         user = request.user
         profile = user.profile
 
-        if profile.profile_image:
-            profile.profile_image.delete(save=False)
+        def replace_file():
+            if profile.profile_image:
+                profile.profile_image.delete(save=False)
+            # FieldFile.save hands the upload to storage, which copies it chunk by chunk
+            profile.profile_image.save(profile_image.name, profile_image, save=False)
 
-        profile.profile_image = profile_image
-        profile.save()
+        # Storage backends are blocking file I/O, so keep them off the event loop
+        await sync_to_async(replace_file)()
+        await profile.asave(update_fields=["profile_image"])
 
         return request.user
 
     @route.get("/", response=List[UserSchema], permissions=[IsAdmin])
-    def list_users(self, request):
-        return User.objects.all()
+    async def list_users(self, request):
+        return JsonResponse(
+            [_user_to_dict(user) async for user in _users_with_profile()], safe=False
+        )
 
     @route.get("/approved", response=List[UserSchema], permissions=[IsAdmin])
     def list_approved_users(self, request):
-        return User.objects.filter(profile__is_approved=True, is_superuser=False).select_related(
-            "profile"
-        )
+        return _users_with_profile().filter(profile__is_approved=True, is_superuser=False)
 
     @route.get("/unapproved", response=List[UserSchema], permissions=[IsAdmin])
     def list_unapproved_users(self, request):
-        return User.objects.filter(profile__is_approved=False, is_superuser=False)
+        return _users_with_profile().filter(profile__is_approved=False, is_superuser=False)
 
     @route.post("/{user_id}/approve", response=UserSchema, permissions=[IsAdmin])
     def approve_user(self, request, user_id: int):
-        user = User.objects.get(id=user_id)
+        user = User.objects.select_related("profile").get(id=user_id)
         user.profile.is_approved = True
-        user.profile.save()
+        user.profile.save(update_fields=["is_approved"])
         return user
 
     @route.delete("/{user_id}/reject", response={200: dict}, permissions=[IsAdmin])
@@ -131,8 +176,8 @@ class UserController:
         return 200, {"message": "User rejected and deleted successfully"}
 
     @route.get("/{user_id}", response=UserSchema, permissions=[IsAdmin])
-    def get_user(self, request, user_id: int):
-        return User.objects.get(id=user_id)
+    async def get_user(self, request, user_id: int):
+        return await _users_with_profile().aget(id=user_id)
 
     @route.patch("/{user_id}/quota", response={200: UserSchema, 404: dict}, permissions=[IsAdmin])
     def update_user_quota(self, request, user_id: int, data: UserQuotaUpdateSchema):
@@ -166,7 +211,7 @@ class UserController:
     @route.get("/me/models", response=List[UserAddedModelSchema])
     def get_user_added_models(self, request, provider: Optional[str] = None):
         """Get list of models added by current user, optionally filtered by provider"""
-        queryset = request.user.added_models.all()
+        queryset = request.user.added_models.only("id", "model_id", "provider", "added_at")
         if provider:
             queryset = queryset.filter(provider=provider)
         return queryset
@@ -207,19 +252,28 @@ class AuthController:
     @route.post("/register", response={201: UserSchema, 400: dict})
     def register_user(self, request, data: UserRegistrationSchema):
         """Public endpoint for user registration"""
-        if User.objects.filter(username=data.username).exists():
-            return 400, {"detail": "Username already exists"}
-
-        if User.objects.filter(email=data.email).exists():
+        clashes = set(
+            User.objects.filter(Q(username=data.username) | Q(email=data.email)).values_list(
+                "username", flat=True
+            )
+        )
+        if clashes:
+            if data.username in clashes:
+                return 400, {"detail": "Username already exists"}
             return 400, {"detail": "Email already exists"}
 
-        user = User.objects.create(
-            username=data.username,
-            email=data.email,
-            password=make_password(data.password),
-            first_name=data.first_name or "",
-            last_name=data.last_name or "",
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create(
+                    username=data.username,
+                    email=data.email,
+                    password=make_password(data.password),
+                    first_name=data.first_name or "",
+                    last_name=data.last_name or "",
+                )
+        except IntegrityError:
+            # Lost a race with a concurrent registration for the same username
+            return 400, {"detail": "Username already exists"}
 
         return 201, user
 
@@ -4,6 +4,19 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 
+class UserAddedModelQuerySet(models.QuerySet):
+    def for_user(self, user, provider: str | None = None):
+        """A user's added models, optionally narrowed to one provider"""
+        queryset = self.filter(user=user)
+        if provider:
+            queryset = queryset.filter(provider=provider)
+        return queryset
+
+    def minimal(self):
+        """Only the columns needed to identify a model"""
+        return self.only("model_id", "provider")
+
+
 class UserAddedModel(models.Model):
     PROVDER_CHOICES = [("openrouter", "OpenRouter"), ("ollama", "Ollama")]
 
@@ -12,9 +25,16 @@ class UserAddedModel(models.Model):
     provider = models.CharField(max_length=20, choices=PROVDER_CHOICES, default="openrouter")
     added_at = models.DateTimeField(auto_now_add=True)
 
+    objects = UserAddedModelQuerySet.as_manager()
+
     class Meta:
-        unique_together = ["user", "model_id", "provider"]
         ordering = ["-added_at"]
+        constraints = [
+            # provider before model_id so the index also serves per-provider listings
+            models.UniqueConstraint(
+                fields=["user", "provider", "model_id"], name="uniq_user_provider_model"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.provider}/{self.model_id}"
@@ -28,6 +48,8 @@ class Profile(models.Model):
     default_provider = models.TextField(blank=True, null=True)
     default_aux_model = models.TextField(blank=True, null=True)
     default_aux_model_provider = models.TextField(blank=True, null=True)
+    # Whether default_aux_model supports structured outputs, None if not checked yet
+    default_aux_model_supports_structured = models.BooleanField(null=True, blank=True)
 
     # User Approval
     is_approved = models.BooleanField(default=False)
@@ -61,8 +83,3 @@ class Profile(models.Model):
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         Profile.objects.create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
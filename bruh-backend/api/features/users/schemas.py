@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from ninja import Schema
+from pydantic import BaseModel
 
 
 class ProfileSchema(Schema):
@@ -30,7 +31,7 @@ class ProfileSchema(Schema):
         return None
 
 
-class ProfileUpdateSchema(Schema):
+class ProfileUpdateSchema(BaseModel):
     bio: Optional[str] = None
     default_model: Optional[str] = None
     default_aux_model: Optional[str] = None
@@ -52,7 +53,7 @@ class UserSchema(Schema):
     profile: Optional[ProfileSchema] = None
 
 
-class UserUpdateSchema(Schema):
+class UserUpdateSchema(BaseModel):
     email: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -65,28 +66,23 @@ class UserAddedModelSchema(Schema):
     added_at: datetime
 
 
-class AddModelSchema(Schema):
+class AddModelSchema(BaseModel):
     model_id: str
     provider: str = "openrouter"
 
 
-class BulkAddModelsSchema(Schema):
+class BulkAddModelsSchema(BaseModel):
     model_ids: List[str]
     provider: str = "openrouter"
 
 
-class RemoveModelSchema(Schema):
-    model_id: str
-    provider: str = "openrouter"
-
-
 class BulkOperationResponseSchema(Schema):
     added: int
     skipped: int
     invalid: List[str] = []
 
 
-class UserRegistrationSchema(Schema):
+class UserRegistrationSchema(BaseModel):
     username: str
     email: str
     password: str
@@ -94,11 +90,11 @@ class UserRegistrationSchema(Schema):
     last_name: Optional[str] = None
 
 
-class LoginSchema(Schema):
+class LoginSchema(BaseModel):
     username: str
     password: str
 
 
-class UserQuotaUpdateSchema(Schema):
+class UserQuotaUpdateSchema(BaseModel):
     daily_ai_limit: Optional[int] = None
     max_flows: Optional[int] = None
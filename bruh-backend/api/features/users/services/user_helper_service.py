@@ -1,9 +1,10 @@
-from typing import Any, Dict, List
+import asyncio
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List
 
-from asgiref.sync import sync_to_async
 from django.db import IntegrityError
 
-from api.features.ai.services.factory import get_ai_service
+from api.features.ai.services.factory import get_ai_service, validate_model_id_cached
 from api.features.users.models import UserAddedModel
 
 
@@ -16,23 +17,21 @@ class UserHelperService:
         Add a model to user's collection (unified interface for both providers)
         Returns (model_instance, error_message)
         """
-        service = get_ai_service(provider)
-
-        # Both services now use validate_model_id()
-        is_valid = await service.validate_model_id(model_id)
+        is_valid = await validate_model_id_cached(provider, model_id)
 
         if not is_valid:
             return None, f"Invalid model ID '{model_id}' - model not found in {provider}"
 
+        # Insert straight away and let uniq_user_provider_model catch duplicates,
+        # rather than a SELECT followed by an INSERT
         try:
-            model, created = await sync_to_async(UserAddedModel.objects.get_or_create)(
+            model = await UserAddedModel.objects.acreate(
                 user=user, model_id=model_id, provider=provider
             )
-            if not created:
-                return None, "Model already added"
-            return model, None
         except IntegrityError:
-            return None, "Failed to add model"
+            return None, "Model already added"
+
+        return model, None
 
     @staticmethod
     async def remove_model_for_user(
@@ -42,14 +41,11 @@ class UserHelperService:
         Remove a model from user's collection
         Returns (success, error_message)
         """
-
-        def _delete():
-            deleted_count, _ = UserAddedModel.objects.filter(
-                user=user, model_id=model_id, provider=provider
-            ).delete()
-            return deleted_count
-
-        deleted_count = await sync_to_async(_delete)()
+        # Nothing references UserAddedModel and it has no delete signals, so the
+        # collector takes its fast path and this is a single DELETE statement
+        deleted_count, _ = await UserAddedModel.objects.filter(
+            user=user, model_id=model_id, provider=provider
+        ).adelete()
 
         if deleted_count == 0:
             return False, "Model not found in your collection"
@@ -61,11 +57,9 @@ class UserHelperService:
         Get list of model IDs added by user
         Returns list of dicts with model_id and provider
         """
-        queryset = UserAddedModel.objects.filter(user=user)
-        if provider:
-            queryset = queryset.filter(provider=provider)
+        queryset = UserAddedModel.objects.for_user(user, provider)
 
-        return await sync_to_async(list)(queryset.values("model_id", "provider"))
+        return [row async for row in queryset.values("model_id", "provider")]
 
     @staticmethod
     async def get_user_available_models(user, provider: str = None) -> Dict[str, List[Dict]]:
@@ -73,47 +67,39 @@ class UserHelperService:
         Get full model details for user's added models from both providers
         Returns dict with 'openrouter' and 'ollama' keys (unified interface)
         """
-        user_models = await UserHelperService.get_user_added_model_ids(user, provider)
-
         result = {"openrouter": [], "ollama": []}
 
-        if not user_models:
-            return result
-
-        # Group by provider
-        openrouter_ids = [m["model_id"] for m in user_models if m["provider"] == "openrouter"]
-        ollama_ids = [m["model_id"] for m in user_models if m["provider"] == "ollama"]
+        queryset = UserAddedModel.objects.for_user(user, provider)
 
-        # Both services now use get_models_by_ids()
-        if openrouter_ids:
-            openrouter_service = get_ai_service("openrouter")
-            found_models = await openrouter_service.get_models_by_ids(openrouter_ids)
-            result["openrouter"] = found_models
+        # Group by provider straight off the rows, no per-row dicts
+        ids_by_provider: DefaultDict[str, List[str]] = defaultdict(list)
+        async for model_id, model_provider in queryset.values_list("model_id", "provider"):
+            ids_by_provider[model_provider].append(model_id)
 
-            # Check for and remove deprecated models
-            found_ids = {m["id"] for m in found_models}
-            deprecated_ids = set(openrouter_ids) - found_ids
-            if deprecated_ids:
-                await sync_to_async(
-                    UserAddedModel.objects.filter(
-                        user=user, provider="openrouter", model_id__in=deprecated_ids
-                    ).delete
-                )()
+        if not ids_by_provider:
+            return result
 
-        if ollama_ids:
-            ollama_service = get_ai_service("ollama")
-            found_models = await ollama_service.get_models_by_ids(ollama_ids)
-            result["ollama"] = found_models
+        async def _resolve(model_provider: str, model_ids: List[str]):
+            # Both services now use get_models_by_ids()
+            found_models = await get_ai_service(model_provider).get_models_by_ids(model_ids)
+            result[model_provider] = found_models
 
             # Check for and remove deprecated models
             found_ids = {m["id"] for m in found_models}
-            deprecated_ids = set(ollama_ids) - found_ids
+            deprecated_ids = set(model_ids) - found_ids
             if deprecated_ids:
-                await sync_to_async(
-                    UserAddedModel.objects.filter(
-                        user=user, provider="ollama", model_id__in=deprecated_ids
-                    ).delete
-                )()
+                await UserAddedModel.objects.filter(
+                    user=user, provider=model_provider, model_id__in=deprecated_ids
+                ).adelete()
+
+        # The providers are independent, so look them up concurrently
+        await asyncio.gather(
+            *(
+                _resolve(model_provider, model_ids)
+                for model_provider, model_ids in ids_by_provider.items()
+                if model_provider in result
+            )
+        )
 
         return result
 
@@ -125,24 +111,27 @@ class UserHelperService:
         Add multiple models at once with validation (unified interface)
         Returns dict with 'added', 'skipped', and 'invalid' counts/lists
         """
-        service = UserHelperService._get_service(provider)
-
-        # Both services now use validate_model_ids()
-        valid_ids, invalid_ids = await service.validate_model_ids(model_ids)
-
-        added = 0
-        skipped = 0
-
-        for model_id in valid_ids:
-            try:
-                _, created = await sync_to_async(UserAddedModel.objects.get_or_create)(
-                    user=user, model_id=model_id, provider=provider
-                )
-                if created:
-                    added += 1
-                else:
-                    skipped += 1
-            except IntegrityError:
-                skipped += 1
-
-        return {"added": added, "skipped": skipped, "invalid": invalid_ids}
+        service = get_ai_service(provider)
+
+        async def _existing_ids():
+            queryset = UserAddedModel.objects.for_user(user, provider).filter(
+                model_id__in=model_ids
+            )
+            return {model_id async for model_id in queryset.values_list("model_id", flat=True)}
+
+        # The existing-id lookup doesn't depend on validation, so run it while the
+        # provider catalog is checked (a network fetch on a cold cache)
+        (valid_ids, invalid_ids), existing = await asyncio.gather(
+            service.validate_model_ids(model_ids), _existing_ids()
+        )
+        to_create = [
+            UserAddedModel(user=user, model_id=model_id, provider=provider)
+            for model_id in dict.fromkeys(valid_ids)
+            if model_id not in existing
+        ]
+        # ignore_conflicts covers rows another request added since the lookup above
+        await UserAddedModel.objects.abulk_create(to_create, ignore_conflicts=True)
+
+        added = len(to_create)
+
+        return {"added": added, "skipped": len(valid_ids) - added, "invalid": invalid_ids}
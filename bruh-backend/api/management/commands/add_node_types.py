@@ -2,13 +2,17 @@ from django.core.management.base import BaseCommand
 
 from api.features.flows.models import Flow
 
+BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Add nodeType field to existing flow nodes"
 
     def handle(self, *args, **options):
-        flows = Flow.objects.all()
         updated_count = 0
+        to_update = []
+
+        flows = Flow.objects.only("id", "flow_data").iterator(chunk_size=BATCH_SIZE)
 
         for flow in flows:
             flow_data = flow.flow_data
@@ -17,14 +21,28 @@ class Command(BaseCommand):
             updated = False
             for node in nodes:
                 # Add nodeType from type if missing
-                if "data" in node and isinstance(node["data"], dict):
-                    if "nodeType" not in node["data"]:
-                        node["data"]["nodeType"] = node.get("type")
-                        updated = True
+                data = node.get("data")
+                if type(data) is dict and "nodeType" not in data:
+                    data["nodeType"] = node.get("type")
+                    updated = True
 
             if updated:
-                flow.flow_data = flow_data
-                flow.save()
+                to_update.append(flow)
                 updated_count += 1
 
+                if len(to_update) >= BATCH_SIZE:
+                    self._write(to_update)
+                    to_update.clear()
+
+        if to_update:
+            self._write(to_update)
+
         self.stdout.write(self.style.SUCCESS(f"Successfully updated {updated_count} flows"))
+
+    @staticmethod
+    def _write(flows):
+        # bulk_update builds a CASE per row, which is overkill for a single flow
+        if len(flows) == 1:
+            Flow.objects.filter(pk=flows[0].pk).update(flow_data=flows[0].flow_data)
+        else:
+            Flow.objects.bulk_update(flows, ["flow_data"])
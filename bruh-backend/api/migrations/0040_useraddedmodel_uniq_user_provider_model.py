@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0039_profile_total_invocations"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="useraddedmodel",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="useraddedmodel",
+            constraint=models.UniqueConstraint(
+                fields=("user", "provider", "model_id"), name="uniq_user_provider_model"
+            ),
+        ),
+    ]
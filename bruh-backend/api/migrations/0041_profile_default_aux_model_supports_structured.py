@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0040_useraddedmodel_uniq_user_provider_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="default_aux_model_supports_structured",
+            field=models.BooleanField(blank=True, null=True),
+        ),
+    ]
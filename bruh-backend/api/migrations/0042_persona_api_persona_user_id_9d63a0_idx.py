@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0041_profile_default_aux_model_supports_structured"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="persona",
+            index=models.Index(fields=["user", "deleted"], name="api_persona_user_id_9d63a0_idx"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0042_persona_api_persona_user_id_9d63a0_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="airesponse",
+            index=models.Index(
+                fields=["provider", "model_used", "created_at"],
+                name="api_airespo_provide_9dc57b_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+INSERT INTO api_airesponsedaily (
+    date,
+    provider,
+    model_used,
+    is_structured_output,
+    request_count,
+    usage_count,
+    cost_count,
+    total_cost,
+    prompt_tokens,
+    completion_tokens,
+    reasoning_tokens,
+    total_tokens,
+    tokened_count,
+    tokened_cost,
+    cost_per_token_sum
+)
+SELECT
+    date(created_at),
+    provider,
+    model_used,
+    COALESCE(is_structured_output, 0),
+    COUNT(*),
+    COUNT(total_tokens),
+    COUNT(cost),
+    COALESCE(SUM(cost), 0),
+    COALESCE(SUM(prompt_tokens), 0),
+    COALESCE(SUM(completion_tokens), 0),
+    COALESCE(SUM(reasoning_tokens), 0),
+    COALESCE(SUM(total_tokens), 0),
+    SUM(CASE WHEN total_tokens > 0 THEN 1 ELSE 0 END),
+    COALESCE(SUM(CASE WHEN total_tokens > 0 THEN cost END), 0),
+    COALESCE(SUM(CASE WHEN total_tokens > 0 THEN CAST(cost AS REAL) / total_tokens END), 0)
+FROM api_airesponse
+GROUP BY 1, 2, 3, 4
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0043_airesponse_api_airespo_provide_9dc57b_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIResponseDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("provider", models.CharField(max_length=50)),
+                ("model_used", models.CharField(max_length=100)),
+                ("is_structured_output", models.BooleanField(default=False)),
+                ("request_count", models.PositiveIntegerField(default=0)),
+                ("usage_count", models.PositiveIntegerField(default=0)),
+                ("cost_count", models.PositiveIntegerField(default=0)),
+                (
+                    "total_cost",
+                    models.DecimalField(decimal_places=6, default=0, max_digits=14),
+                ),
+                ("prompt_tokens", models.BigIntegerField(default=0)),
+                ("completion_tokens", models.BigIntegerField(default=0)),
+                ("reasoning_tokens", models.BigIntegerField(default=0)),
+                ("total_tokens", models.BigIntegerField(default=0)),
+                ("tokened_count", models.PositiveIntegerField(default=0)),
+                (
+                    "tokened_cost",
+                    models.DecimalField(decimal_places=6, default=0, max_digits=14),
+                ),
+                ("cost_per_token_sum", models.FloatField(default=0)),
+            ],
+            options={
+                "ordering": ["-date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "provider", "model_used", "is_structured_output"),
+                        name="uniq_airesponse_daily_bucket",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
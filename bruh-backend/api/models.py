@@ -1,4 +1,7 @@
-from .features.ai.models import AIResponse
+# Django registers the "api" app's models by importing this module during app loading,
+# so the feature models must be imported here eagerly; loading them lazily would hide
+# them from migrate/makemigrations until something else happened to import them.
+from .features.ai.models import AIResponse, AIResponseDaily
 from .features.conversations.models import Conversation, Message
 from .features.flows.models import (
     Flow,
@@ -13,6 +16,7 @@ from .features.users.models import Profile, UserAddedModel
 
 __all__ = [
     "AIResponse",
+    "AIResponseDaily",
     "UserAddedModel",
     "Conversation",
     "Message",
@@ -1,6 +1,9 @@
 # streamlit_app.py
+import csv
+import os
 import sqlite3
-from datetime import datetime
+import tempfile
+from datetime import datetime, timedelta
 
 import pandas as pd
 import plotly.express as px
@@ -13,142 +16,258 @@ st.set_page_config(
 )
 
 
+DB_PATH = "db/db.sqlite3"
+
+# Columns that can be shown in the Detailed View
+DETAIL_COLUMNS = (
+    "id",
+    "provider",
+    "model_used",
+    "finish_reason",
+    "prompt_tokens",
+    "completion_tokens",
+    "image_tokens",
+    "reasoning_tokens",
+    "total_tokens",
+    "estimated_prompt_cost",
+    "estimated_completion_cost",
+    "estimated_reasoning_cost",
+    "upstream_inference_cost",
+    "upstream_inference_prompt_cost",
+    "upstream_inference_completions_cost",
+    "cost",
+    "created_at",
+    "is_structured_output",
+    "request_id",
+)
+CATEGORY_COLUMNS = ("provider", "model_used")
+PAGE_SIZE = 100
+EXPORT_CHUNK_SIZE = 5000
+
+
 # Database connection
 @st.cache_resource
 def get_connection():
-    return sqlite3.connect("db/db.sqlite3", check_same_thread=False)
+    return sqlite3.connect(DB_PATH, check_same_thread=False)
+
 
+def get_db_version():
+    # The backend runs in WAL mode, so fresh writes land in the -wal file
+    # before they are checkpointed into the main database file
+    version = []
+    for path in (DB_PATH, f"{DB_PATH}-wal"):
+        try:
+            version.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            version.append(0)
+    return tuple(version)
 
-@st.cache_data(ttl=60)
-def load_data():
+
+@st.cache_data(max_entries=1)
+def load_dimensions(db_version):
+    """Values for the sidebar filters, read from the daily rollup"""
     conn = get_connection()
-    query = """
-    SELECT
-        id,
-        provider,
-        model_used,
-        finish_reason,
-        prompt_tokens,
-        completion_tokens,
-        image_tokens,
-        reasoning_tokens,
-        total_tokens,
-        estimated_prompt_cost,
-        estimated_completion_cost,
-        estimated_reasoning_cost,
-        upstream_inference_cost,
-        upstream_inference_prompt_cost,
-        upstream_inference_completions_cost,
-        cost,
-        created_at,
-        is_structured_output,
-        request_id
-    FROM api_airesponse
-    ORDER BY created_at DESC
+    model_pairs = pd.read_sql_query(
+        "SELECT DISTINCT provider, model_used FROM api_airesponsedaily", conn
+    )
+    bounds = conn.execute(
+        "SELECT MIN(date), MAX(date), SUM(request_count) FROM api_airesponsedaily"
+    ).fetchone()
+    return model_pairs, bounds
+
+
+def build_where(filters, date_column):
+    provider, model, structured, start_date, end_date = filters
+    conditions = []
+    params = []
+
+    if provider is not None:
+        conditions.append("provider = ?")
+        params.append(provider)
+    if model is not None:
+        conditions.append("model_used = ?")
+        params.append(model)
+    if structured is not None:
+        # The rollup stores NULL as False, so the raw table is read the same way
+        conditions.append("COALESCE(is_structured_output, 0) = ?")
+        params.append(structured)
+    if start_date is not None:
+        conditions.append(f"{date_column} >= ?")
+        params.append(start_date.isoformat())
+    if end_date is not None:
+        conditions.append(f"{date_column} < ?")
+        params.append((end_date + timedelta(days=1)).isoformat())
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, params
+
+
+@st.cache_data(max_entries=32)
+def load_rollup(db_version, filters):
     """
-    df = pd.read_sql_query(query, conn)
-    df["created_at"] = pd.to_datetime(df["created_at"])
+    Per-day, per-model usage totals maintained by the backend (AIResponseDaily); every
+    chart is computed from these instead of from individual responses
+    """
+    where, params = build_where(filters, "date")
+    query = f"""
+    SELECT *
+    FROM api_airesponsedaily
+    {where}
+    ORDER BY date
+    """
+    df = pd.read_sql_query(query, get_connection(), params=params)
+    df["date"] = pd.to_datetime(df["date"])
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype("category")
     return df
 
 
-# Load data
-try:
-    df = load_data()
+@st.cache_data(max_entries=32)
+def count_responses(db_version, filters):
+    where, params = build_where(filters, "created_at")
+    query = f"SELECT COUNT(*) FROM api_airesponse {where}"
+    return get_connection().execute(query, params).fetchone()[0]
 
-    if df.empty:
-        st.warning("No data found in the database.")
-        st.stop()
 
-except Exception as e:
-    st.error(f"Error loading data: {e}")
-    st.stop()
-
-# Title
-st.title("💰 AI Response Cost Explorer")
-st.markdown("---")
-
-# Sidebar filters
-st.sidebar.header("🔍 Filters")
-
-# Provider filter
-providers = ["All"] + sorted(df["provider"].dropna().unique().tolist())
-selected_provider = st.sidebar.selectbox("Provider", providers)
-
-# Model filter
-if selected_provider != "All":
-    models = ["All"] + sorted(
-        df[df["provider"] == selected_provider]["model_used"].dropna().unique().tolist()
-    )
-else:
-    models = ["All"] + sorted(df["model_used"].dropna().unique().tolist())
-selected_model = st.sidebar.selectbox("Model", models)
+def responses_query(filters, columns):
+    """Newest-first SELECT shared by the Detailed View and the CSV export"""
+    where, params = build_where(filters, "created_at")
+    query = f"""
+    SELECT {", ".join(columns)}
+    FROM api_airesponse
+    {where}
+    ORDER BY created_at DESC
+    """
+    return query, params
+
+
+@st.cache_data(max_entries=32)
+def load_page(db_version, filters, columns, page):
+    """One page of individual responses for the Detailed View, newest first"""
+    query, params = responses_query(filters, columns)
+    query += "LIMIT ? OFFSET ?"
+    params = [*params, PAGE_SIZE, (page - 1) * PAGE_SIZE]
+    df = pd.read_sql_query(query, get_connection(), params=params)
+    if "created_at" in df:
+        df["created_at"] = pd.to_datetime(df["created_at"])
+    return df
 
-# Structured output filter
-structured_options = {"All": None, "Structured Only": True, "Non-Structured Only": False}
-selected_structured = st.sidebar.selectbox("Output Type", list(structured_options.keys()))
 
-# Date range filter
-min_date = df["created_at"].min().date()
-max_date = df["created_at"].max().date()
+def write_export(filters, columns, out):
+    """Write the matching responses to `out` as CSV, fetching EXPORT_CHUNK_SIZE rows at a time"""
+    query, params = responses_query(filters, columns)
+    writer = csv.writer(out)
+    writer.writerow(columns)
 
-date_range = st.sidebar.date_input(
-    "Date Range", value=(min_date, max_date), min_value=min_date, max_value=max_date
-)
+    # A single query read in chunks; OFFSET paging rescans skipped rows and can skip or
+    # repeat rows when responses are written between pages
+    cursor = get_connection().execute(query, params)
+    while rows := cursor.fetchmany(EXPORT_CHUNK_SIZE):
+        writer.writerows(rows)
 
-# Apply filters
-filtered_df = df.copy()
 
-if selected_provider != "All":
-    filtered_df = filtered_df[filtered_df["provider"] == selected_provider]
+def ratio(numerator, denominator):
+    return numerator / denominator if denominator else float("nan")
 
-if selected_model != "All":
-    filtered_df = filtered_df[filtered_df["model_used"] == selected_model]
 
-if structured_options[selected_structured] is not None:
-    filtered_df = filtered_df[
-        filtered_df["is_structured_output"] == structured_options[selected_structured]
-    ]
+# Aggregations are cached per filter combination, so reruns triggered by other widgets
+# (like the column picker) only redraw the charts
+@st.cache_data(max_entries=32)
+def summary_stats(db_version, filters):
+    df = load_rollup(db_version, filters)
+    total_cost = df["total_cost"].sum()
+    total_tokens = df["total_tokens"].sum()
+    return {
+        "total_requests": int(df["request_count"].sum()),
+        "total_cost": total_cost,
+        "avg_cost": ratio(total_cost, df["cost_count"].sum()),
+        "total_tokens": total_tokens,
+        "avg_tokens": ratio(total_tokens, df["usage_count"].sum()),
+    }
 
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    filtered_df = filtered_df[
-        (filtered_df["created_at"].dt.date >= start_date)
-        & (filtered_df["created_at"].dt.date <= end_date)
-    ]
 
-# Summary metrics
-st.header("📊 Summary Statistics")
+@st.cache_data(max_entries=32)
+def daily_costs(db_version, filters):
+    df = load_rollup(db_version, filters)
+    daily_agg = df.groupby("date").agg({"total_cost": "sum", "request_count": "sum"}).reset_index()
+    daily_agg["cumulative_cost"] = daily_agg["total_cost"].cumsum()
+    return daily_agg
+
+
+@st.cache_data(max_entries=32)
+def provider_costs(db_version, filters):
+    df = load_rollup(db_version, filters)
+    return df.groupby("provider", observed=True)["total_cost"].sum().rename("cost").reset_index()
+
+
+@st.cache_data(max_entries=32)
+def model_summary(db_version, filters):
+    """Every per-model figure the charts use, from a single groupby pass"""
+    df = load_rollup(db_version, filters)
+    per_model = (
+        df.groupby("model_used", observed=True, sort=False)[
+            [
+                "total_cost",
+                "cost_count",
+                "usage_count",
+                "prompt_tokens",
+                "completion_tokens",
+                "total_tokens",
+                "tokened_count",
+                "tokened_cost",
+                "cost_per_token_sum",
+            ]
+        ]
+        .sum()
+        .rename_axis("model")
+        .reset_index()
+    )
+    # 0 / 0 comes out as NaN, the same as a mean over no values
+    return per_model.assign(
+        avg_cost=per_model["total_cost"] / per_model["cost_count"],
+        avg_prompt_tokens=per_model["prompt_tokens"] / per_model["usage_count"],
+        avg_completion_tokens=per_model["completion_tokens"] / per_model["usage_count"],
+        avg_total_tokens=per_model["total_tokens"] / per_model["usage_count"],
+        cost_per_token=per_model["cost_per_token_sum"] / per_model["tokened_count"],
+    )
 
-col1, col2, col3, col4, col5 = st.columns(5)
 
-total_requests = len(filtered_df)
-total_cost = filtered_df["cost"].sum() if "cost" in filtered_df.columns else 0
-avg_cost = filtered_df["cost"].mean() if "cost" in filtered_df.columns else 0
-total_tokens = filtered_df["total_tokens"].sum() if "total_tokens" in filtered_df.columns else 0
-avg_tokens = filtered_df["total_tokens"].mean() if "total_tokens" in filtered_df.columns else 0
+@st.cache_data(max_entries=32)
+def token_totals(db_version, filters):
+    df = load_rollup(db_version, filters)
+    return df[["prompt_tokens", "completion_tokens", "reasoning_tokens"]].sum()
 
-col1.metric("Total Requests", f"{total_requests:,}")
-col2.metric("Total Cost", f"${total_cost:.4f}")
-col3.metric("Avg Cost/Request", f"${avg_cost:.4f}")
-col4.metric("Total Tokens", f"{total_tokens:,.0f}")
-col5.metric("Avg Tokens/Request", f"{avg_tokens:,.0f}")
 
-st.markdown("---")
+@st.cache_data(max_entries=32)
+def daily_tokens(db_version, filters):
+    df = load_rollup(db_version, filters)
+    return (
+        df.groupby("date")
+        .agg({"prompt_tokens": "sum", "completion_tokens": "sum", "total_tokens": "sum"})
+        .reset_index()
+    )
 
-# Charts
-tab1, tab2, tab3, tab4, tab5 = st.tabs(
-    ["📈 Cost Over Time", "🥧 Cost Breakdown", "🔢 Token Usage", "📋 Detailed View", "💡 Insights"]
-)
 
-with tab1:
-    st.subheader("Cost Trends")
+@st.cache_data(max_entries=32)
+def structured_costs(db_version, filters):
+    df = load_rollup(db_version, filters)
+    structured_comparison = (
+        df.groupby("is_structured_output")
+        .agg({"total_cost": "sum", "cost_count": "sum"})
+        .reset_index()
+    )
+    structured_comparison.columns = ["structured", "total_cost", "count"]
+    structured_comparison["avg_cost"] = (
+        structured_comparison["total_cost"] / structured_comparison["count"]
+    )
+    return structured_comparison
 
-    # Daily cost aggregation
-    daily_cost = filtered_df.copy()
-    daily_cost["date"] = daily_cost["created_at"].dt.date
-    daily_agg = daily_cost.groupby("date").agg({"cost": "sum", "id": "count"}).reset_index()
-    daily_agg.columns = ["date", "total_cost", "request_count"]
 
+# Figures are built once per filter combination and reused across reruns; cache_resource
+# hands back the same object instead of unpickling (and re-validating) a copy
+@st.cache_resource(max_entries=32)
+def daily_cost_figure(db_version, filters):
+    daily_agg = daily_costs(db_version, filters)
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -167,13 +286,14 @@ with tab1:
         hovermode="x unified",
         height=400,
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-    # Cumulative cost
-    daily_agg["cumulative_cost"] = daily_agg["total_cost"].cumsum()
 
-    fig2 = go.Figure()
-    fig2.add_trace(
+@st.cache_resource(max_entries=32)
+def cumulative_cost_figure(db_version, filters):
+    daily_agg = daily_costs(db_version, filters)
+    fig = go.Figure()
+    fig.add_trace(
         go.Scatter(
             x=daily_agg["date"],
             y=daily_agg["cumulative_cost"],
@@ -183,47 +303,42 @@ with tab1:
             line=dict(color="#2ca02c", width=2),
         )
     )
-    fig2.update_layout(
+    fig.update_layout(
         title="Cumulative Cost",
         xaxis_title="Date",
         yaxis_title="Cumulative Cost ($)",
         hovermode="x unified",
         height=400,
     )
-    st.plotly_chart(fig2, use_container_width=True)
-
-with tab2:
-    st.subheader("Cost Distribution")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        # Cost by provider
-        provider_cost = filtered_df.groupby("provider")["cost"].sum().reset_index()
-        fig = px.pie(
-            provider_cost, values="cost", names="provider", title="Cost by Provider", hole=0.4
-        )
-        fig.update_traces(textposition="inside", textinfo="percent+label+value")
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        # Cost by model
-        model_cost = filtered_df.groupby("model_used")["cost"].sum().reset_index()
-        model_cost = model_cost.sort_values("cost", ascending=False).head(10)
-        fig = px.pie(
-            model_cost, values="cost", names="model_used", title="Cost by Model (Top 10)", hole=0.4
-        )
-        fig.update_traces(textposition="inside", textinfo="percent+label")
-        st.plotly_chart(fig, use_container_width=True)
-
-    # Cost breakdown bar chart
-    cost_breakdown = (
-        filtered_df.groupby("model_used").agg({"cost": "sum", "id": "count"}).reset_index()
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def provider_cost_figure(db_version, filters):
+    provider_cost = provider_costs(db_version, filters)
+    fig = px.pie(provider_cost, values="cost", names="provider", title="Cost by Provider", hole=0.4)
+    fig.update_traces(textposition="inside", textinfo="percent+label+value")
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def model_cost_figure(db_version, filters):
+    models_by_cost = model_summary(db_version, filters).sort_values("total_cost", ascending=False)
+    fig = px.pie(
+        models_by_cost.head(10),
+        values="total_cost",
+        names="model",
+        title="Cost by Model (Top 10)",
+        hole=0.4,
     )
-    cost_breakdown.columns = ["model", "total_cost", "request_count"]
-    cost_breakdown["avg_cost"] = cost_breakdown["total_cost"] / cost_breakdown["request_count"]
-    cost_breakdown = cost_breakdown.sort_values("total_cost", ascending=False).head(15)
+    fig.update_traces(textposition="inside", textinfo="percent+label")
+    return fig
+
 
+@st.cache_resource(max_entries=32)
+def cost_breakdown_figure(db_version, filters):
+    models_by_cost = model_summary(db_version, filters).sort_values("total_cost", ascending=False)
+    cost_breakdown = models_by_cost.head(15)
     fig = go.Figure(
         data=[
             go.Bar(name="Total Cost", x=cost_breakdown["model"], y=cost_breakdown["total_cost"]),
@@ -236,69 +351,53 @@ with tab2:
         height=500,
         xaxis_tickangle=-45,
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-with tab3:
-    st.subheader("Token Usage Analysis")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        # Token distribution
-        token_data = filtered_df[["prompt_tokens", "completion_tokens", "reasoning_tokens"]].sum()
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=token_data.index,
-                    y=token_data.values,
-                    marker_color=["#1f77b4", "#ff7f0e", "#2ca02c"],
-                )
-            ]
-        )
-        fig.update_layout(
-            title="Token Distribution",
-            xaxis_title="Token Type",
-            yaxis_title="Total Tokens",
-            height=400,
-        )
-        st.plotly_chart(fig, use_container_width=True)
+@st.cache_resource(max_entries=32)
+def token_distribution_figure(db_version, filters):
+    token_data = token_totals(db_version, filters)
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=token_data.index,
+                y=token_data.values,
+                marker_color=["#1f77b4", "#ff7f0e", "#2ca02c"],
+            )
+        ]
+    )
+    fig.update_layout(
+        title="Token Distribution",
+        xaxis_title="Token Type",
+        yaxis_title="Total Tokens",
+        height=400,
+    )
+    return fig
 
-    with col2:
-        # Average tokens per model
-        avg_tokens = (
-            filtered_df.groupby("model_used")
-            .agg({"prompt_tokens": "mean", "completion_tokens": "mean", "total_tokens": "mean"})
-            .reset_index()
-            .sort_values("total_tokens", ascending=False)
-            .head(10)
-        )
 
-        fig = go.Figure()
-        fig.add_trace(
-            go.Bar(name="Prompt", x=avg_tokens["model_used"], y=avg_tokens["prompt_tokens"])
-        )
-        fig.add_trace(
-            go.Bar(name="Completion", x=avg_tokens["model_used"], y=avg_tokens["completion_tokens"])
-        )
-        fig.update_layout(
-            title="Avg Tokens per Model (Top 10)",
-            xaxis_title="Model",
-            yaxis_title="Average Tokens",
-            barmode="stack",
-            height=400,
-            xaxis_tickangle=-45,
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-    # Token usage over time
-    daily_tokens = filtered_df.copy()
-    daily_tokens["date"] = daily_tokens["created_at"].dt.date
-    daily_token_agg = (
-        daily_tokens.groupby("date")
-        .agg({"prompt_tokens": "sum", "completion_tokens": "sum", "total_tokens": "sum"})
-        .reset_index()
+@st.cache_resource(max_entries=32)
+def avg_tokens_figure(db_version, filters):
+    model_stats = model_summary(db_version, filters)
+    avg_tokens = model_stats.sort_values("avg_total_tokens", ascending=False).head(10)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name="Prompt", x=avg_tokens["model"], y=avg_tokens["avg_prompt_tokens"]))
+    fig.add_trace(
+        go.Bar(name="Completion", x=avg_tokens["model"], y=avg_tokens["avg_completion_tokens"])
     )
+    fig.update_layout(
+        title="Avg Tokens per Model (Top 10)",
+        xaxis_title="Model",
+        yaxis_title="Average Tokens",
+        barmode="stack",
+        height=400,
+        xaxis_tickangle=-45,
+    )
+    return fig
+
 
+@st.cache_resource(max_entries=32)
+def daily_tokens_figure(db_version, filters):
+    daily_token_agg = daily_tokens(db_version, filters)
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -325,7 +424,137 @@ with tab3:
         hovermode="x unified",
         height=400,
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+# Load data
+try:
+    db_version = get_db_version()
+    model_pairs, (first_date, last_date, total_records) = load_dimensions(db_version)
+
+    if not total_records:
+        st.warning("No data found in the database.")
+        st.stop()
+
+except Exception as e:
+    st.error(f"Error loading data: {e}")
+    st.stop()
+
+# Title
+st.title("💰 AI Response Cost Explorer")
+st.markdown("---")
+
+# Sidebar filters
+st.sidebar.header("🔍 Filters")
+
+# Provider filter
+providers = ["All"] + sorted(model_pairs["provider"].dropna().unique().tolist())
+selected_provider = st.sidebar.selectbox("Provider", providers)
+
+# Model filter
+if selected_provider != "All":
+    models = ["All"] + sorted(
+        model_pairs[model_pairs["provider"] == selected_provider]["model_used"]
+        .dropna()
+        .unique()
+        .tolist()
+    )
+else:
+    models = ["All"] + sorted(model_pairs["model_used"].dropna().unique().tolist())
+selected_model = st.sidebar.selectbox("Model", models)
+
+# Structured output filter
+structured_options = {"All": None, "Structured Only": True, "Non-Structured Only": False}
+selected_structured = st.sidebar.selectbox("Output Type", list(structured_options.keys()))
+
+# Date range filter
+min_date = pd.Timestamp(first_date).date()
+max_date = pd.Timestamp(last_date).date()
+
+date_range = st.sidebar.date_input(
+    "Date Range", value=(min_date, max_date), min_value=min_date, max_value=max_date
+)
+
+# Apply filters (in SQLite, so only the matching rows are loaded)
+start_date = end_date = None
+if len(date_range) == 2:
+    start_date, end_date = date_range
+
+filters = (
+    None if selected_provider == "All" else selected_provider,
+    None if selected_model == "All" else selected_model,
+    structured_options[selected_structured],
+    start_date,
+    end_date,
+)
+
+try:
+    summary = summary_stats(db_version, filters)
+except Exception as e:
+    st.error(f"Error loading data: {e}")
+    st.stop()
+
+# Summary metrics
+st.header("📊 Summary Statistics")
+
+col1, col2, col3, col4, col5 = st.columns(5)
+
+col1.metric("Total Requests", f"{summary['total_requests']:,}")
+col2.metric("Total Cost", f"${summary['total_cost']:.4f}")
+col3.metric("Avg Cost/Request", f"${summary['avg_cost']:.4f}")
+col4.metric("Total Tokens", f"{summary['total_tokens']:,.0f}")
+col5.metric("Avg Tokens/Request", f"{summary['avg_tokens']:,.0f}")
+
+st.markdown("---")
+
+# Charts
+model_stats = model_summary(db_version, filters)
+models_by_cost = model_stats.sort_values("total_cost", ascending=False)
+
+tab1, tab2, tab3, tab4, tab5 = st.tabs(
+    ["📈 Cost Over Time", "🥧 Cost Breakdown", "🔢 Token Usage", "📋 Detailed View", "💡 Insights"]
+)
+
+with tab1:
+    st.subheader("Cost Trends")
+
+    # Daily cost aggregation
+    st.plotly_chart(daily_cost_figure(db_version, filters), use_container_width=True)
+
+    # Cumulative cost
+    st.plotly_chart(cumulative_cost_figure(db_version, filters), use_container_width=True)
+
+with tab2:
+    st.subheader("Cost Distribution")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Cost by provider
+        st.plotly_chart(provider_cost_figure(db_version, filters), use_container_width=True)
+
+    with col2:
+        # Cost by model
+        st.plotly_chart(model_cost_figure(db_version, filters), use_container_width=True)
+
+    # Cost breakdown bar chart
+    st.plotly_chart(cost_breakdown_figure(db_version, filters), use_container_width=True)
+
+with tab3:
+    st.subheader("Token Usage Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Token distribution
+        st.plotly_chart(token_distribution_figure(db_version, filters), use_container_width=True)
+
+    with col2:
+        # Average tokens per model
+        st.plotly_chart(avg_tokens_figure(db_version, filters), use_container_width=True)
+
+    # Token usage over time
+    st.plotly_chart(daily_tokens_figure(db_version, filters), use_container_width=True)
 
 with tab4:
     st.subheader("Detailed Data")
@@ -333,7 +562,7 @@ with tab4:
     # Display options
     show_cols = st.multiselect(
         "Select columns to display",
-        options=filtered_df.columns.tolist(),
+        options=DETAIL_COLUMNS,
         default=[
             "created_at",
             "provider",
@@ -345,19 +574,27 @@ with tab4:
     )
 
     if show_cols:
-        display_df = filtered_df[show_cols].copy()
-        display_df = display_df.sort_values("created_at", ascending=False)
+        # The names are interpolated into the SELECT, so only pass through known columns
+        columns = tuple(column for column in show_cols if column in DETAIL_COLUMNS)
+        page_count = max(1, -(-count_responses(db_version, filters) // PAGE_SIZE))
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        st.caption(f"Page {page} of {page_count}")
 
+        display_df = load_page(db_version, filters, columns, page)
         st.dataframe(display_df, use_container_width=True, height=400)
 
-        # Download button
-        csv = display_df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name=f"ai_costs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-        )
+        # Export only on request. Rows go to a temp file in chunks rather than through a
+        # DataFrame, but download_button still reads the finished CSV into memory
+        if st.button("📦 Prepare CSV export"):
+            with tempfile.TemporaryFile(mode="w+", newline="") as export_file:
+                write_export(filters, columns, export_file)
+                export_file.seek(0)
+                st.download_button(
+                    label="📥 Download CSV",
+                    data=export_file,
+                    file_name=f"ai_costs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv",
+                )
 
 with tab5:
     st.subheader("💡 Insights & Recommendations")
@@ -366,51 +603,35 @@ with tab5:
 
     with col1:
         st.markdown("### Most Expensive Models")
-        expensive_models = (
-            filtered_df.groupby("model_used").agg({"cost": ["sum", "mean", "count"]}).reset_index()
-        )
-        expensive_models.columns = ["model", "total_cost", "avg_cost", "count"]
-        expensive_models = expensive_models.sort_values("total_cost", ascending=False).head(5)
+        expensive_models = models_by_cost.head(5)
 
         for idx, row in expensive_models.iterrows():
             st.markdown(f"""
             **{row["model"]}**
             - Total: ${row["total_cost"]:.4f}
             - Average: ${row["avg_cost"]:.4f}
-            - Requests: {row["count"]:.0f}
+            - Requests: {row["cost_count"]:.0f}
             """)
 
     with col2:
         st.markdown("### Most Efficient Models (by cost/token)")
-        efficiency = filtered_df[filtered_df["total_tokens"] > 0].copy()
-        efficiency["cost_per_token"] = efficiency["cost"] / efficiency["total_tokens"]
         efficient_models = (
-            efficiency.groupby("model_used")
-            .agg({"cost_per_token": "mean", "cost": "sum", "id": "count"})
-            .reset_index()
+            model_stats[model_stats["tokened_count"] > 0].sort_values("cost_per_token").head(5)
         )
-        efficient_models.columns = ["model", "cost_per_token", "total_cost", "count"]
-        efficient_models = efficient_models.sort_values("cost_per_token").head(5)
 
         for idx, row in efficient_models.iterrows():
             st.markdown(f"""
             **{row["model"]}**
             - Cost/Token: ${row["cost_per_token"]:.6f}
-            - Total: ${row["total_cost"]:.4f}
-            - Requests: {row["count"]:.0f}
+            - Total: ${row["tokened_cost"]:.4f}
+            - Requests: {row["tokened_count"]:.0f}
             """)
 
     # Structured vs Non-Structured
     st.markdown("### Structured vs Non-Structured Output")
-    structured_comparison = (
-        filtered_df.groupby("is_structured_output")
-        .agg({"cost": ["sum", "mean", "count"]})
-        .reset_index()
-    )
+    structured_comparison = structured_costs(db_version, filters)
 
     if not structured_comparison.empty:
-        structured_comparison.columns = ["structured", "total_cost", "avg_cost", "count"]
-
         col1, col2 = st.columns(2)
 
         for idx, row in structured_comparison.iterrows():
@@ -423,7 +644,7 @@ with tab5:
 # Footer
 st.markdown("---")
 st.markdown(
-    f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total records: {len(df):,}*"
+    f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total records: {total_records:,}*"
 )
 
 # Refresh button
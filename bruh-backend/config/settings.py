@@ -102,6 +102,18 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db" / "db.sqlite3",
+        # Persistent connections stay off: under daphne the sync ORM runs on sync_to_async
+        # worker threads whose connections the request signals don't reliably close
+        "CONN_MAX_AGE": 0,
+        "OPTIONS": {
+            # WAL lets the web server and the celery worker read while the other writes,
+            # and IMMEDIATE takes the write lock up front instead of failing mid-transaction
+            "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;",
+            "transaction_mode": "IMMEDIATE",
+            # The web server and the celery worker contend for the same file; wait for
+            # the write lock rather than raising "database is locked" after 5s
+            "timeout": 20,
+        },
     }
 }
 
@@ -143,7 +155,8 @@ USE_TZ = True
 STATIC_URL = "static/"
 MEDIA_URL = "/media/"
 
-FILE_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB
+# Uploads above this spill to a temp file instead of being held in memory
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024  # 256KB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB
 
 MEDIA_ROOT = CONFIG.media_root if CONFIG else (BASE_DIR / "media")
@@ -1,21 +1,15 @@
-import json
-from functools import lru_cache
+import threading
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 
 class OpenRouterConfig(BaseModel):
-    open_router_api_key: str = Field(..., min_length=1)
+    # Checked by pydantic-core itself rather than a Python field_validator callback
+    open_router_api_key: str = Field(..., min_length=1, pattern=r"^sk-or-")
     open_router_default_model: str = Field(..., min_length=1)
 
-    @field_validator("open_router_api_key")
-    def validate_open_router_api_key(cls, v: str):
-        if not v.startswith("sk-or-"):
-            raise ValueError("OpenRouter api key must start with 'sk-or-'")
-        return v
-
 
 class OllamaConfig(BaseModel):
     ollama_host: str = Field(..., min_length=1)
@@ -38,9 +32,9 @@ class Config(BaseModel):
 
 class ConfigService:
     _config: Optional[Config] = None
+    _lock = threading.Lock()
 
     @classmethod
-    @lru_cache(maxsize=1)
     def load_config(cls, config_path: str = "config.json") -> Config:
         """Load and validate configuration from JSON file"""
         path = Path(config_path)
@@ -51,25 +45,26 @@ class ConfigService:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found at: {path}")
 
-        with open(path, "r") as f:
-            config_data = json.load(f)
-
-        cls._config = Config(**config_data)
+        # pydantic-core parses and validates straight from the raw bytes
+        cls._config = Config.model_validate_json(path.read_bytes())
         return cls._config
 
     @classmethod
     def get_config(cls) -> Optional[Config]:
         if cls._config is None:
-            cls.load_config()
+            with cls._lock:
+                if cls._config is None:
+                    cls.load_config()
 
         return cls._config
 
     @classmethod
     def reload_config(cls, config_path: str = "config.json") -> Config:
-        cls._config = None
-        cls.load_config.cache_clear()
-        return cls.load_config(config_path)
+        with cls._lock:
+            cls._config = None
+            return cls.load_config(config_path)
 
 
 def get_config() -> Optional[Config]:
-    return ConfigService.get_config()
+    # Once loaded, skip the classmethod dispatch and the lock check
+    return ConfigService._config or ConfigService.get_config()